@@ -12,43 +12,144 @@ It parses command line arguments and runs the bot accordingly.
 
 import os
 import sys
-import argparse
-import logging
-from dotenv import load_dotenv
+from types import SimpleNamespace
 
-# Import local modules
-try:
-    from .linkedin_job_bot import LinkedInJobBot
-    from .config import validate_config
-except ImportError:
-    # Handle case when running as standalone
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from linkedin_job_bot import LinkedInJobBot
-    from config import validate_config
+# Heavy imports (logging setup, Selenium via linkedin_job_bot) are deferred
+# into main() so that --help and argument errors exit before paying for them.
+
+# Parent directory of the package, resolved once for the standalone-script
+# import path below instead of re-deriving it on every main() call.
+_PKG_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_USAGE = (
+    "usage: linkedin_job_bot [-h] [--keywords KEYWORDS] [--location LOCATION]\n"
+    "                        [--max-applications MAX_APPLICATIONS] [--headless]\n"
+    "                        [--rate-per-min RATE_PER_MIN] [--sessions SESSIONS]\n"
+    "                        [--daemon] [--request] [--gui]"
+)
+
+_HELP = _USAGE + """
+
+LinkedIn Job Application Bot
+
+options:
+  -h, --help            show this help message and exit
+  --keywords KEYWORDS   Job keywords to search for (comma-separate for
+                        multiple queries)
+  --location LOCATION   Job location to search for (comma-separate for
+                        multiple queries)
+  --sessions SESSIONS   Concurrent browser sessions: fan-out for multi-query
+                        runs (default 2), parallel apply phase for a single
+                        query (default 1, max 3)
+  --max-applications MAX_APPLICATIONS
+                        Maximum number of applications to submit
+  --headless            Run in headless mode
+  --rate-per-min RATE_PER_MIN
+                        Target applications per minute
+  --daemon              Run as a long-lived server, reusing one browser session
+  --request             Submit this search to a running daemon
+  --gui                 Launch the graphical user interface
+"""
+
+# Options that consume a value, mapped to (attribute, converter)
+_VALUE_OPTIONS = {
+    "--keywords": ("keywords", str),
+    "--location": ("location", str),
+    "--max-applications": ("max_applications", int),
+    "--rate-per-min": ("rate_per_min", float),
+    "--sessions": ("sessions", int),
+}
+
+# Boolean flags mapped to their attribute
+_FLAG_OPTIONS = {
+    "--headless": "headless",
+    "--daemon": "daemon",
+    "--request": "request",
+    "--gui": "gui",
+}
+
+
+def _arg_error(message: str) -> None:
+    print(_USAGE, file=sys.stderr)
+    print(f"linkedin_job_bot: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def parse_args(argv, defaults) -> SimpleNamespace:
+    """
+    Parse command line arguments with a minimal hand-rolled loop.
+
+    argparse builds help formatters and regex machinery at startup just to
+    handle five flags; a direct scan over argv keeps the CLI cold-start
+    cheap while preserving --help and argparse-style error reporting.
+
+    Args:
+        argv: Argument list (without the program name).
+        defaults: Mapping of attribute name to default value.
+
+    Returns:
+        Namespace with keywords, location, max_applications, headless, gui.
+    """
+    args = SimpleNamespace(**defaults)
+    i = 0
+    while i < len(argv):
+        name, eq, inline = argv[i].partition("=")
+        if name in ("-h", "--help"):
+            print(_HELP)
+            sys.exit(0)
+        elif name in _VALUE_OPTIONS:
+            dest, convert = _VALUE_OPTIONS[name]
+            if eq:
+                raw = inline
+            elif i + 1 < len(argv):
+                i += 1
+                raw = argv[i]
+            else:
+                _arg_error(f"argument {name}: expected one argument")
+            try:
+                setattr(args, dest, convert(raw))
+            except ValueError:
+                _arg_error(f"argument {name}: invalid {convert.__name__} value: {raw!r}")
+        elif name in _FLAG_OPTIONS and not eq:
+            setattr(args, _FLAG_OPTIONS[name], True)
+        else:
+            _arg_error(f"unrecognized arguments: {argv[i]}")
+        i += 1
+    return args
 
 
 def main():
     """
     Main function to run the LinkedIn job application bot from the command line.
     """
-    # Load environment variables
-    load_dotenv()
-    
-    # Set up argument parser
-    parser = argparse.ArgumentParser(description='LinkedIn Job Application Bot')
-    parser.add_argument('--keywords', type=str, default=os.getenv('DEFAULT_KEYWORDS', 'Data Analyst'), 
-                        help='Job keywords to search for')
-    parser.add_argument('--location', type=str, default=os.getenv('DEFAULT_LOCATION', 'Remote'), 
-                        help='Job location to search for')
-    parser.add_argument('--max-applications', type=int, default=int(os.getenv('DEFAULT_MAX_APPLICATIONS', '20')), 
-                        help='Maximum number of applications to submit')
-    parser.add_argument('--headless', action='store_true', default=os.getenv('HEADLESS_MODE', 'False').lower() == 'true',
-                        help='Run in headless mode')
-    parser.add_argument('--gui', action='store_true',
-                        help='Launch the graphical user interface')
-    
-    args = parser.parse_args()
-    
+    # Import config first (it is light and loads the .env once) so the
+    # argument defaults below see values from the .env file. Decide the
+    # import style explicitly rather than catching ImportError: the bare
+    # except also swallowed unrelated import failures inside the imported
+    # modules and silently retried with a modified sys.path.
+    if __package__:
+        from . import config
+    else:
+        # Running as a standalone script
+        sys.path.append(_PKG_PARENT)
+        import config
+
+    # Resolve argument defaults from config's environment snapshot up front
+    # instead of hitting os.getenv once per option.
+    args = parse_args(sys.argv[1:], {
+        'keywords': config._ENV.get('DEFAULT_KEYWORDS', 'Data Analyst'),
+        'location': config._ENV.get('DEFAULT_LOCATION', 'Remote'),
+        'max_applications': int(config._ENV.get('DEFAULT_MAX_APPLICATIONS', '20')),
+        'headless': config._envbool('HEADLESS_MODE'),
+        'rate_per_min': float(config._ENV.get('RATE_PER_MIN', '12')),
+        # None until --sessions is passed, so multi-query runs and the
+        # single-query parallel apply phase can apply different defaults.
+        'sessions': None,
+        'daemon': False,
+        'request': False,
+        'gui': False,
+    })
+
     # If GUI flag is set, launch the GUI
     if args.gui:
         try:
@@ -57,22 +158,44 @@ def main():
             return
         except ImportError:
             print("Error: GUI module not found. Running in command line mode.")
-    
+
+    # Only now pull in the heavy modules: logging setup and the bot itself,
+    # which drags in Selenium. --help and argument errors never reach here.
+    import logging
+    if __package__:
+        from . import linkedin_job_bot as bot_module
+    else:
+        import linkedin_job_bot as bot_module
+
+    # Client mode needs no browser, config, or logging of its own
+    if args.request:
+        ok = bot_module.main_request(args.keywords, args.location, args.max_applications)
+        sys.exit(0 if ok else 1)
+
     # Validate configuration
-    error = validate_config()
+    error = config.validate_config()
     if error:
         print(f"Configuration error: {error}")
         print("Please check your .env file or provide the necessary environment variables.")
         sys.exit(1)
     
-    # Set up logging
+    # Set up logging. The file handler sits behind a MemoryHandler so log
+    # records hit disk in batches rather than one write() per line; errors
+    # flush immediately and logging.shutdown() flushes the rest on exit.
+    # force=True replaces (and closes) the handlers linkedin_job_bot
+    # installed at import time — without it this call is a no-op and the
+    # configured LOG_LEVEL never takes effect.
+    import logging.handlers
+    file_handler = logging.FileHandler("linkedin_bot.log")
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
     logging.basicConfig(
-        level=logging.INFO,
+        level=getattr(logging, config.LOG_LEVEL.upper(), logging.INFO),
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler("linkedin_bot.log"),
+            logging.handlers.MemoryHandler(256, flushLevel=logging.ERROR, target=file_handler),
             logging.StreamHandler()
-        ]
+        ],
+        force=True,
     )
     logger = logging.getLogger(__name__)
     
@@ -82,12 +205,29 @@ def main():
     logger.info(f"Job Location: {args.location}")
     logger.info(f"Max Applications: {args.max_applications}")
     logger.info(f"Headless Mode: {args.headless}")
-    
+
+    if args.daemon:
+        bot_module.main_daemon(headless=args.headless, rate_per_min=args.rate_per_min)
+        return
+
+    keyword_list = [k.strip() for k in args.keywords.split(',') if k.strip()]
+    location_list = [l.strip() for l in args.location.split(',') if l.strip()]
+
     try:
-        # Create and run the bot
-        bot = LinkedInJobBot(headless=args.headless)
-        bot.run(args.keywords, args.location, args.max_applications)
-    
+        if len(keyword_list) > 1 or len(location_list) > 1:
+            bot_module.run_multi(keyword_list, location_list, args.max_applications,
+                                 headless=args.headless, rate_per_min=args.rate_per_min,
+                                 sessions=args.sessions if args.sessions is not None else 2)
+            return
+
+        # Create and run the bot; the context manager guarantees the browser
+        # and the applications CSV are closed however run() exits. For a
+        # single query, --sessions drives the parallel apply phase; without
+        # the flag the run stays serial as before.
+        with bot_module.LinkedInJobBot(headless=args.headless, rate_per_min=args.rate_per_min,
+                                       parallel_sessions=args.sessions or 1) as bot:
+            bot.run(args.keywords, args.location, args.max_applications)
+
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     
@@ -8,62 +8,194 @@ This module handles loading environment variables and provides default settings
 for the bot. Users can customize these settings by creating a .env file.
 """
 
+import functools
 import os
+import pickle
+import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+from dotenv import load_dotenv, dotenv_values
+
+# Pickled snapshot of the parsed .env, keyed by the .env file's mtime
+_ENV_CACHE_PATH = ".env.cache.pkl"
+
+
+def _load_env_cached() -> None:
+    """
+    Load environment variables from .env, using a pickled snapshot when the
+    file is unchanged.
+
+    Parsing the text .env file tokenizes every line on each start; a pickle
+    load of the already-parsed dict is a single binary read. The snapshot is
+    keyed by the .env file's mtime and rebuilt whenever the file changes.
+    """
+    try:
+        mtime = os.stat(".env").st_mtime
+    except OSError:
+        # No .env next to us; let dotenv search parent directories as before.
+        load_dotenv()
+        return
+
+    try:
+        with open(_ENV_CACHE_PATH, "rb") as f:
+            cached_mtime, values = pickle.load(f)
+        if cached_mtime == mtime and isinstance(values, dict):
+            for key, value in values.items():
+                os.environ.setdefault(key, value)
+            return
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        pass
+
+    load_dotenv(".env")
+    values = {k: v for k, v in dotenv_values(".env").items() if v is not None}
+    try:
+        # The snapshot mirrors the .env contents, credentials included, so
+        # create it owner-only just like the .env file itself. os.open only
+        # applies the mode on creation; fchmod tightens a pre-existing cache.
+        fd = os.open(_ENV_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((mtime, values), f)
+    except OSError:
+        pass
+
 
 # Load environment variables from .env file
-load_dotenv()
+_load_env_cached()
+
+# Snapshot of the environment; populated by _load_settings() so the settings
+# resolve against a plain dict instead of hitting os.environ per lookup.
+_ENV: Dict[str, str] = {}
+
+# Accepted truthy spellings for boolean environment variables
+_TRUE = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+
+def _envbool(name: str, default: bool = False) -> bool:
+    """
+    Parse a boolean environment variable from the snapshot.
 
-# LinkedIn credentials
-LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
-LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
+    Args:
+        name: Environment variable name.
+        default: Value to return when the variable is unset.
+
+    Returns:
+        The parsed boolean value.
+    """
+    value = _ENV.get(name)
+    return default if value is None else value.strip().lower() in _TRUE
+
+def _load_settings() -> None:
+    """
+    (Re)compute the module-level settings from the current environment.
+
+    Runs once at import and again from refresh() after the .env file has
+    been rewritten (e.g. by the GUI's save_settings).
+    """
+    global _ENV, LINKEDIN_EMAIL, LINKEDIN_PASSWORD, PHONE_NUMBER, RESUME_PATH, \
+        COVER_LETTER_PATH, DEFAULT_KEYWORDS, DEFAULT_LOCATION, \
+        DEFAULT_MAX_APPLICATIONS, HEADLESS_MODE, BROWSER_TIMEOUT, \
+        WAIT_TIME_MIN, WAIT_TIME_MAX, FOLLOW_COMPANIES, OUTPUT_DIR, \
+        LOG_LEVEL, DEFAULT_ANSWERS
+
+    _ENV = dict(os.environ)
+
+    # LinkedIn credentials
+    LINKEDIN_EMAIL = _ENV.get("LINKEDIN_EMAIL")
+    LINKEDIN_PASSWORD = _ENV.get("LINKEDIN_PASSWORD")
+
+    # User information
+    PHONE_NUMBER = _ENV.get("PHONE_NUMBER", "")
+    RESUME_PATH = _ENV.get("RESUME_PATH", "")
+    COVER_LETTER_PATH = _ENV.get("COVER_LETTER_PATH", "")
 
-# User information
-PHONE_NUMBER = os.getenv("PHONE_NUMBER", "")
-RESUME_PATH = os.getenv("RESUME_PATH", "")
-COVER_LETTER_PATH = os.getenv("COVER_LETTER_PATH", "")
+    # Job search settings
+    DEFAULT_KEYWORDS = _ENV.get("DEFAULT_KEYWORDS", "Data Analyst")
+    DEFAULT_LOCATION = _ENV.get("DEFAULT_LOCATION", "Remote")
+    DEFAULT_MAX_APPLICATIONS = int(_ENV.get("DEFAULT_MAX_APPLICATIONS", "20"))
 
-# Job search settings
-DEFAULT_KEYWORDS = os.getenv("DEFAULT_KEYWORDS", "Data Analyst")
-DEFAULT_LOCATION = os.getenv("DEFAULT_LOCATION", "Remote")
-DEFAULT_MAX_APPLICATIONS = int(os.getenv("DEFAULT_MAX_APPLICATIONS", "20"))
+    # Browser settings
+    HEADLESS_MODE = _envbool("HEADLESS_MODE")
+    BROWSER_TIMEOUT = int(_ENV.get("BROWSER_TIMEOUT", "10"))
 
-# Browser settings
-HEADLESS_MODE = os.getenv("HEADLESS_MODE", "False").lower() == "true"
-BROWSER_TIMEOUT = int(os.getenv("BROWSER_TIMEOUT", "10"))
+    # Application settings
+    WAIT_TIME_MIN = float(_ENV.get("WAIT_TIME_MIN", "1.0"))
+    WAIT_TIME_MAX = float(_ENV.get("WAIT_TIME_MAX", "3.0"))
+    FOLLOW_COMPANIES = _envbool("FOLLOW_COMPANIES")
 
-# Application settings
-WAIT_TIME_MIN = float(os.getenv("WAIT_TIME_MIN", "1.0"))
-WAIT_TIME_MAX = float(os.getenv("WAIT_TIME_MAX", "3.0"))
-FOLLOW_COMPANIES = os.getenv("FOLLOW_COMPANIES", "False").lower() == "true"
+    # Output settings
+    OUTPUT_DIR = _ENV.get("OUTPUT_DIR", "output")
+    LOG_LEVEL = _ENV.get("LOG_LEVEL", "INFO")
 
-# Output settings
-OUTPUT_DIR = os.getenv("OUTPUT_DIR", "output")
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    # Application questions defaults. Built once per load and exposed
+    # read-only so consumers share one mapping and can't mutate it.
+    DEFAULT_ANSWERS = MappingProxyType({
+        "years_of_experience": _ENV.get("DEFAULT_YEARS_EXPERIENCE", "2"),
+        "education_level": _ENV.get("DEFAULT_EDUCATION", "Bachelor's"),
+        "willing_to_relocate": _ENV.get("WILLING_TO_RELOCATE", "No"),
+        "require_sponsorship": _ENV.get("REQUIRE_SPONSORSHIP", "No"),
+        "remote_work": _ENV.get("REMOTE_WORK", "Yes"),
+    })
 
-# Application questions defaults
-DEFAULT_ANSWERS = {
-    "years_of_experience": os.getenv("DEFAULT_YEARS_EXPERIENCE", "2"),
-    "education_level": os.getenv("DEFAULT_EDUCATION", "Bachelor's"),
-    "willing_to_relocate": os.getenv("WILLING_TO_RELOCATE", "No"),
-    "require_sponsorship": os.getenv("REQUIRE_SPONSORSHIP", "No"),
-    "remote_work": os.getenv("REMOTE_WORK", "Yes"),
-}
 
-# Create output directory if it doesn't exist
-Path(OUTPUT_DIR).mkdir(exist_ok=True)
+_load_settings()
 
 
-def get_config() -> Dict[str, Any]:
+def refresh() -> None:
     """
-    Get the configuration as a dictionary.
-    
+    Re-read the .env file and rebuild all cached configuration state.
+
+    Call this after the .env file has been rewritten; it forces dotenv to
+    override existing environment values, recomputes the module settings,
+    and drops the memoized get_config()/validate_config() results.
+    """
+    load_dotenv(".env" if os.path.exists(".env") else None, override=True)
+    _load_settings()
+    get_config.cache_clear()
+    validate_config.cache_clear()
+
+def ensure_output_dir() -> Path:
+    """
+    Create the output directory if it doesn't exist.
+
+    Deferred to first use so that commands that never write output (--help,
+    create_env_template, ...) don't touch the filesystem at import time.
+
     Returns:
-        Dictionary containing all configuration settings.
+        Path to the output directory.
+    """
+    path = Path(OUTPUT_DIR)
+    path.mkdir(exist_ok=True)
+    return path
+
+
+def _intern_keys(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of a dict with all string keys interned, recursively.
+
+    Interned keys let CPython's dict lookup use pointer comparison instead of
+    a full string compare for callers that index into the config repeatedly.
     """
     return {
+        sys.intern(key): _intern_keys(value) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Mapping[str, Any]:
+    """
+    Get the configuration as a read-only mapping.
+
+    The result is memoized: the nested mapping is built once, its keys are
+    interned, and every later call returns the same object instead of
+    reallocating it.
+
+    Returns:
+        Mapping containing all configuration settings.
+    """
+    return MappingProxyType(_intern_keys({
         "linkedin": {
             "email": LINKEDIN_EMAIL,
             "password": LINKEDIN_PASSWORD,
@@ -92,78 +224,94 @@ def get_config() -> Dict[str, Any]:
             "dir": OUTPUT_DIR,
             "log_level": LOG_LEVEL,
         },
-    }
+    }))
 
 
+@functools.lru_cache(maxsize=1)
 def validate_config() -> Optional[str]:
     """
     Validate the configuration.
-    
+
+    The result is cached for the process lifetime so that the CLI and GUI
+    paths don't both re-stat the resume/cover-letter files; use
+    validate_config.cache_clear() after changing the configured paths.
+
     Returns:
         Error message if configuration is invalid, None otherwise.
     """
     if not LINKEDIN_EMAIL:
         return "LinkedIn email is not set. Please set the LINKEDIN_EMAIL environment variable."
-    
+
     if not LINKEDIN_PASSWORD:
         return "LinkedIn password is not set. Please set the LINKEDIN_PASSWORD environment variable."
-    
-    if RESUME_PATH and not os.path.exists(RESUME_PATH):
-        return f"Resume file not found at {RESUME_PATH}. Please check the RESUME_PATH environment variable."
-    
-    if COVER_LETTER_PATH and not os.path.exists(COVER_LETTER_PATH):
-        return f"Cover letter file not found at {COVER_LETTER_PATH}. Please check the COVER_LETTER_PATH environment variable."
-    
+
+    # A single os.stat per path replaces the exists() probe and avoids the
+    # exists-then-open race for files that disappear in between.
+    for path, var_name, label in (
+        (RESUME_PATH, "RESUME_PATH", "Resume"),
+        (COVER_LETTER_PATH, "COVER_LETTER_PATH", "Cover letter"),
+    ):
+        if path:
+            try:
+                os.stat(path)
+            except OSError:
+                return f"{label} file not found at {path}. Please check the {var_name} environment variable."
+
     return None
 
 
+# Template for create_env_template, kept as a module-level constant so the
+# text is allocated once and written straight through without an
+# intermediate string per call.
+_TEMPLATE_LINES = (
+    "# LinkedIn Job Application Bot Configuration\n",
+    "\n",
+    "# LinkedIn credentials\n",
+    "LINKEDIN_EMAIL=your.email@example.com\n",
+    "LINKEDIN_PASSWORD=your_password\n",
+    "\n",
+    "# User information\n",
+    "PHONE_NUMBER=1234567890\n",
+    "RESUME_PATH=path/to/your/resume.pdf\n",
+    "COVER_LETTER_PATH=path/to/your/cover_letter.pdf\n",
+    "\n",
+    "# Job search settings\n",
+    "DEFAULT_KEYWORDS=Data Analyst\n",
+    "DEFAULT_LOCATION=Remote\n",
+    "DEFAULT_MAX_APPLICATIONS=20\n",
+    "\n",
+    "# Browser settings\n",
+    "HEADLESS_MODE=False\n",
+    "BROWSER_TIMEOUT=10\n",
+    "\n",
+    "# Application settings\n",
+    "WAIT_TIME_MIN=1.0\n",
+    "WAIT_TIME_MAX=3.0\n",
+    "FOLLOW_COMPANIES=False\n",
+    "\n",
+    "# Output settings\n",
+    "OUTPUT_DIR=output\n",
+    "LOG_LEVEL=INFO\n",
+    "\n",
+    "# Default answers for application questions\n",
+    "DEFAULT_YEARS_EXPERIENCE=2\n",
+    "DEFAULT_EDUCATION=Bachelor's\n",
+    "WILLING_TO_RELOCATE=No\n",
+    "REQUIRE_SPONSORSHIP=No\n",
+    "REMOTE_WORK=Yes\n",
+)
+
+
 def create_env_template(output_path: str = ".env.template") -> None:
     """
     Create a template .env file with all available configuration options.
-    
+
     Args:
         output_path: Path to write the template file.
     """
-    template = """# LinkedIn Job Application Bot Configuration
-
-# LinkedIn credentials
-LINKEDIN_EMAIL=your.email@example.com
-LINKEDIN_PASSWORD=your_password
-
-# User information
-PHONE_NUMBER=1234567890
-RESUME_PATH=path/to/your/resume.pdf
-COVER_LETTER_PATH=path/to/your/cover_letter.pdf
-
-# Job search settings
-DEFAULT_KEYWORDS=Data Analyst
-DEFAULT_LOCATION=Remote
-DEFAULT_MAX_APPLICATIONS=20
-
-# Browser settings
-HEADLESS_MODE=False
-BROWSER_TIMEOUT=10
-
-# Application settings
-WAIT_TIME_MIN=1.0
-WAIT_TIME_MAX=3.0
-FOLLOW_COMPANIES=False
-
-# Output settings
-OUTPUT_DIR=output
-LOG_LEVEL=INFO
-
-# Default answers for application questions
-DEFAULT_YEARS_EXPERIENCE=2
-DEFAULT_EDUCATION=Bachelor's
-WILLING_TO_RELOCATE=No
-REQUIRE_SPONSORSHIP=No
-REMOTE_WORK=Yes
-"""
-    
     with open(output_path, "w") as f:
-        f.write(template)
-    
+        f.writelines(_TEMPLATE_LINES)
+
     print(f"Created environment template at {output_path}")
 
 
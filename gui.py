@@ -9,6 +9,11 @@ application bot. It allows users to enter search keywords, filters, and other
 settings without having to modify the code or environment variables.
 """
 
+import collections
+import concurrent.futures
+import functools
+import io
+import logging
 import os
 import sys
 import threading
@@ -16,17 +21,107 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Dict, Any, Optional, Callable
 
-from dotenv import load_dotenv
+# Maximum number of lines kept in the log Text widget; older lines are
+# trimmed so the widget doesn't slow down or leak over long sessions.
+MAX_LOG_LINES = 2000
 
-# Import local modules
+# File type filters for the Browse... dialogs, built once at module scope
+# instead of per click.
+PDF_FILETYPES = (("PDF files", "*.pdf"), ("All files", "*.*"))
+
+
+# Line templates for the saved .env file, built once at import; save_settings
+# streams them through a StringIO buffer, formatting one small line at a time
+# instead of materializing the whole file as a single temporary string.
+ENV_TEMPLATE_LINES = (
+    "# LinkedIn Job Application Bot Configuration\n",
+    "\n",
+    "# LinkedIn credentials\n",
+    "LINKEDIN_EMAIL={email}\n",
+    "LINKEDIN_PASSWORD={password}\n",
+    "\n",
+    "# User information\n",
+    "PHONE_NUMBER={phone}\n",
+    "RESUME_PATH={resume_path}\n",
+    "COVER_LETTER_PATH={cover_letter_path}\n",
+    "\n",
+    "# Job search settings\n",
+    "DEFAULT_KEYWORDS={keywords}\n",
+    "DEFAULT_LOCATION={location}\n",
+    "DEFAULT_MAX_APPLICATIONS={max_applications}\n",
+    "\n",
+    "# Browser settings\n",
+    "HEADLESS_MODE={headless}\n",
+    "BROWSER_TIMEOUT=10\n",
+    "\n",
+    "# Application settings\n",
+    "WAIT_TIME_MIN=1.0\n",
+    "WAIT_TIME_MAX=3.0\n",
+    "FOLLOW_COMPANIES={follow_companies}\n",
+    "\n",
+    "# Output settings\n",
+    "OUTPUT_DIR=output\n",
+    "LOG_LEVEL=INFO\n",
+    "\n",
+    "# Default answers for application questions\n",
+    "DEFAULT_YEARS_EXPERIENCE={years_experience}\n",
+    "DEFAULT_EDUCATION={education_level}\n",
+    "WILLING_TO_RELOCATE={relocate}\n",
+    "REQUIRE_SPONSORSHIP={sponsorship}\n",
+    "REMOTE_WORK={remote_work}\n",
+)
+
+
+def _write_env_atomic(content: str, path: str = ".env") -> None:
+    """
+    Write the .env payload atomically.
+
+    The content is written to a temp file with a single os.write, fsynced,
+    and renamed over the target, so a crash mid-save can never leave a torn
+    .env behind. The file is created owner-only since it holds credentials.
+
+    Args:
+        content: Full text of the .env file.
+        path: Destination path.
+    """
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, content.encode("utf-8"))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+# Import local modules. Only the light config module is imported here;
+# linkedin_job_bot drags in Selenium (hundreds of ms), so run_bot imports it
+# lazily and the window paints without paying that cost.
 try:
-    from .config import get_config, validate_config
-    from .linkedin_job_bot import LinkedInJobBot
+    from .config import get_config, validate_config, refresh as refresh_config
 except ImportError:
     # Handle case when running as standalone
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from config import get_config, validate_config
-    from linkedin_job_bot import LinkedInJobBot
+    from config import get_config, validate_config, refresh as refresh_config
+
+
+class _GuiLogHandler(logging.Handler):
+    """
+    Logging handler that forwards formatted records to the GUI's log buffer.
+
+    update_log only appends to a thread-safe deque, so emit() is safe to call
+    from the bot's worker thread without touching Tk.
+    """
+
+    def __init__(self, app: "LinkedInJobBotGUI"):
+        super().__init__()
+        self.app = app
+        self.setFormatter(logging.Formatter('%(message)s'))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.app.update_log(self.format(record))
+        except Exception:
+            self.handleError(record)
 
 
 class LinkedInJobBotGUI:
@@ -46,35 +141,72 @@ class LinkedInJobBotGUI:
         self.root.geometry("800x600")
         self.root.minsize(600, 500)
         
-        # Load configuration
-        load_dotenv()
+        # Load configuration. Importing config already parsed the .env once;
+        # get_config() is memoized, so construction does no file I/O here.
         self.config = get_config()
         
-        # Create variables for form fields
-        self.email_var = tk.StringVar(value=self.config["linkedin"]["email"] or "")
-        self.password_var = tk.StringVar(value=self.config["linkedin"]["password"] or "")
-        self.phone_var = tk.StringVar(value=self.config["user"]["phone_number"] or "")
-        self.resume_path_var = tk.StringVar(value=self.config["user"]["resume_path"] or "")
-        self.cover_letter_path_var = tk.StringVar(value=self.config["user"]["cover_letter_path"] or "")
-        self.keywords_var = tk.StringVar(value=self.config["search"]["keywords"] or "")
-        self.location_var = tk.StringVar(value=self.config["search"]["location"] or "")
-        self.max_applications_var = tk.IntVar(value=self.config["search"]["max_applications"])
+        # Initial form values from config. Most fields are only read when
+        # saving or starting, so the widgets are created from these values
+        # and read back directly with .get() — no per-field StringVar and no
+        # Tcl variable trace per keystroke. Only the check/radio buttons,
+        # which need two-way binding, keep Tk variables.
+        answers = self.config["application"]["default_answers"]
+        self._initial = {
+            "email": self.config["linkedin"]["email"] or "",
+            "password": self.config["linkedin"]["password"] or "",
+            "phone": self.config["user"]["phone_number"] or "",
+            "resume_path": self.config["user"]["resume_path"] or "",
+            "cover_letter_path": self.config["user"]["cover_letter_path"] or "",
+            "keywords": self.config["search"]["keywords"] or "",
+            "location": self.config["search"]["location"] or "",
+            "max_applications": str(self.config["search"]["max_applications"]),
+            "years_experience": answers["years_of_experience"],
+            "education_level": answers["education_level"],
+            "experience_level": "All",
+            "job_type": "All",
+            "date_posted": "Any time",
+        }
+
+        # Form widgets keyed by field name, registered as the tabs are built.
+        # Reads go through _field_get, which falls back to the initial values
+        # for fields whose tab hasn't been constructed yet.
+        self.fields: Dict[str, Any] = {}
+
+        # Stat results (path -> size in bytes, or None for missing) captured
+        # when a file is picked, plus the inline labels that display them;
+        # the pick is the only time the file is statted.
+        self._stat_cache: Dict[str, Optional[int]] = {}
+        self._path_labels: Dict[str, ttk.Label] = {}
+
+        # Check/radio variables need to exist before their tab is built,
+        # since save_settings reads them regardless of which tabs were opened.
         self.headless_var = tk.BooleanVar(value=self.config["browser"]["headless"])
-        
+        self.easy_apply_var = tk.BooleanVar(value=True)
+        self.follow_companies_var = tk.BooleanVar(value=False)
+        self.relocate_var = tk.StringVar(value=answers["willing_to_relocate"])
+        self.sponsorship_var = tk.StringVar(value=answers["require_sponsorship"])
+        self.remote_work_var = tk.StringVar(value=answers["remote_work"])
+
         # Create the main frame
         self.main_frame = ttk.Frame(self.root, padding=10)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
-        
+
         # Create notebook (tabs)
         self.notebook = ttk.Notebook(self.main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Create tabs
-        self.create_credentials_tab()
-        self.create_search_tab()
-        self.create_settings_tab()
-        self.create_log_tab()
-        
+
+        # Register the tabs but build each one's widgets the first time it is
+        # selected, so opening the window only pays for the visible tab.
+        self.log_text: Optional[tk.Text] = None
+        self._pending_tabs: Dict[str, tuple] = {}
+        self._add_lazy_tab("Credentials", self.create_credentials_tab)
+        self._add_lazy_tab("Job Search", self.create_search_tab)
+        self._add_lazy_tab("Settings", self.create_settings_tab)
+        self._add_lazy_tab("Log", self.create_log_tab)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # The initial selection happened before the binding; build it now.
+        self._on_tab_changed()
+
         # Create buttons frame
         self.buttons_frame = ttk.Frame(self.main_frame)
         self.buttons_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -93,268 +225,243 @@ class LinkedInJobBotGUI:
             command=self.save_settings
         )
         self.save_button.pack(side=tk.RIGHT, padx=5)
-        
-        # Initialize log text
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, "LinkedIn Job Application Bot\n")
-        self.log_text.insert(tk.END, "Please configure your settings and click 'Start Job Application Bot'\n")
-        self.log_text.config(state=tk.DISABLED)
-        
-        # Bot instance and thread
+
+        # Bot instance and its worker. A single-thread pool is reused across
+        # runs, and the Future it returns gives cheap done() checks plus
+        # exception plumbing without per-run Thread objects. The stop event
+        # is shared with the bot so on_close can ask it to finish cleanly.
         self.bot = None
-        self.bot_thread = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="bot"
+        )
+        self._bot_future: Optional[concurrent.futures.Future] = None
+        self._stop = threading.Event()
+
+        # Directory of the last file picked in a Browse... dialog
+        self._last_dir = ""
+
+        # Fingerprint of the form fields at the last validation, and the
+        # result it produced; Start and Save share the cached result while
+        # those fields are unchanged.
+        self._validated_fp = None
+        self._validation_error: Optional[str] = None
+
+        # Buffered log messages, flushed into the Text widget in batches so
+        # bursts of bot output cost one widget update instead of one per line.
+        self._log_buf = collections.deque(maxlen=5000)
+        self._log_lock = threading.Lock()
+        self.root.after(100, self._flush_log)
+
+        # Initial log text; shown when the Log tab is first opened
+        self.update_log("LinkedIn Job Application Bot")
+        self.update_log("Please configure your settings and click 'Start Job Application Bot'")
         
         # Set up protocol for window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
-    def create_credentials_tab(self) -> None:
+    def _add_lazy_tab(self, text: str, builder: Callable[[ttk.Frame], None]) -> None:
+        """
+        Add an empty tab whose contents are built on first selection.
+
+        Args:
+            text: Tab label.
+            builder: create_*_tab method that populates the tab's frame.
+        """
+        frame = ttk.Frame(self.notebook, padding=10)
+        self.notebook.add(frame, text=text)
+        self._pending_tabs[str(frame)] = (frame, builder)
+
+    def _on_tab_changed(self, event: Optional[Any] = None) -> None:
+        """
+        Build the newly selected tab's widgets if they don't exist yet.
+        """
+        pending = self._pending_tabs.pop(self.notebook.select(), None)
+        if pending:
+            frame, builder = pending
+            builder(frame)
+
+    def _field_get(self, key: str) -> str:
+        """
+        Read a form field's current value.
+
+        Falls back to the field's initial value when the tab holding the
+        widget hasn't been built yet.
+
+        Args:
+            key: Field name in self.fields / self._initial.
+
+        Returns:
+            The field's value as a string.
+        """
+        widget = self.fields.get(key)
+        return widget.get() if widget is not None else self._initial.get(key, "")
+
+    def _make_entry(self, parent: tk.Widget, key: str, width: int = 40, **kwargs) -> ttk.Entry:
+        """
+        Create an Entry pre-filled with the field's initial value and register
+        it in self.fields for direct reads.
+
+        Args:
+            parent: Parent widget.
+            key: Field name in self._initial / self.fields.
+            width: Entry width.
+            **kwargs: Extra Entry options (e.g. show="*").
+
+        Returns:
+            The created Entry.
+        """
+        entry = ttk.Entry(parent, width=width, **kwargs)
+        entry.insert(0, self._initial.get(key, ""))
+        self.fields[key] = entry
+        return entry
+
+    def _build_rows(self, parent: tk.Widget, rows: tuple) -> None:
+        """
+        Build a tab's grid of widgets from row descriptors.
+
+        Each descriptor is a tuple whose first element names the row kind:
+
+            ("header", text)                       bold section label
+            ("entry", label, key, options)         label + Entry in self.fields
+            ("spin", label, key, options)          label + Spinbox in self.fields
+            ("combo", label, key, values, width)   label + Combobox in self.fields
+            ("check", text, var_attr, initial)     Checkbutton on a BooleanVar
+            ("radio", label, var_attr, initial)    Yes/No radio pair on a StringVar
+            ("browse", label, key, title)          Entry + Browse... button
+            ("spacer",)                            trailing blank row
+
+        One loop over data replaces a hand-coded grid() pair per widget;
+        future fields are a descriptor line instead of new layout code.
+
+        Args:
+            parent: The tab frame to populate.
+            rows: Sequence of row descriptors.
+        """
+        for row, desc in enumerate(rows):
+            kind = desc[0]
+            if kind != "header" and kind not in ("check", "spacer"):
+                ttk.Label(parent, text=desc[1]).grid(
+                    row=row, column=0, sticky=tk.W, pady=2
+                )
+
+            if kind == "header":
+                ttk.Label(parent, text=desc[1], font=("", 12, "bold")).grid(
+                    row=row, column=0, columnspan=3, sticky=tk.W,
+                    pady=(0, 10) if row == 0 else (20, 10)
+                )
+            elif kind == "entry":
+                self._make_entry(parent, desc[2], **desc[3]).grid(
+                    row=row, column=1, sticky=tk.W, pady=2
+                )
+            elif kind == "spin":
+                spinbox = ttk.Spinbox(parent, **desc[3])
+                spinbox.set(self._initial[desc[2]])
+                self.fields[desc[2]] = spinbox
+                spinbox.grid(row=row, column=1, sticky=tk.W, pady=2)
+            elif kind == "combo":
+                combobox = ttk.Combobox(parent, values=desc[3], width=desc[4])
+                combobox.set(self._initial[desc[2]])
+                self.fields[desc[2]] = combobox
+                combobox.grid(row=row, column=1, sticky=tk.W, pady=2)
+            elif kind == "check":
+                # Reuse a variable created elsewhere (e.g. headless_var in
+                # __init__); otherwise create and attach one.
+                var = getattr(self, desc[2], None)
+                if var is None:
+                    var = tk.BooleanVar(value=desc[3])
+                    setattr(self, desc[2], var)
+                ttk.Checkbutton(parent, text=desc[1], variable=var).grid(
+                    row=row, column=0, columnspan=2, sticky=tk.W, pady=2
+                )
+            elif kind == "radio":
+                var = getattr(self, desc[2], None)
+                if var is None:
+                    var = tk.StringVar(value=desc[3])
+                    setattr(self, desc[2], var)
+                radio_frame = ttk.Frame(parent)
+                radio_frame.grid(row=row, column=1, sticky=tk.W, pady=2)
+                ttk.Radiobutton(radio_frame, text="Yes", variable=var, value="Yes").pack(side=tk.LEFT)
+                ttk.Radiobutton(radio_frame, text="No", variable=var, value="No").pack(side=tk.LEFT, padx=10)
+            elif kind == "browse":
+                browse_frame = ttk.Frame(parent)
+                browse_frame.grid(row=row, column=1, sticky=tk.W, pady=2)
+                self._make_entry(browse_frame, desc[2], width=30).pack(side=tk.LEFT)
+                ttk.Button(browse_frame, text="Browse...", command=functools.partial(
+                    self.browse_file, desc[2], desc[3], PDF_FILETYPES
+                )).pack(side=tk.LEFT, padx=5)
+                status_label = ttk.Label(browse_frame)
+                status_label.pack(side=tk.LEFT, padx=5)
+                self._path_labels[desc[2]] = status_label
+            elif kind == "spacer":
+                ttk.Label(parent, text="").grid(row=row, column=0, pady=20)
+
+    def create_credentials_tab(self, credentials_frame: ttk.Frame) -> None:
         """
         Create the credentials tab.
         """
-        credentials_frame = ttk.Frame(self.notebook, padding=10)
-        self.notebook.add(credentials_frame, text="Credentials")
-        
-        # LinkedIn credentials
-        ttk.Label(credentials_frame, text="LinkedIn Credentials", font=("", 12, "bold")).grid(
-            row=0, column=0, columnspan=3, sticky=tk.W, pady=(0, 10)
-        )
-        
-        ttk.Label(credentials_frame, text="Email:").grid(
-            row=1, column=0, sticky=tk.W, pady=2
-        )
-        ttk.Entry(credentials_frame, textvariable=self.email_var, width=40).grid(
-            row=1, column=1, sticky=tk.W, pady=2
-        )
-        
-        ttk.Label(credentials_frame, text="Password:").grid(
-            row=2, column=0, sticky=tk.W, pady=2
-        )
-        ttk.Entry(credentials_frame, textvariable=self.password_var, show="*", width=40).grid(
-            row=2, column=1, sticky=tk.W, pady=2
-        )
-        
-        # User information
-        ttk.Label(credentials_frame, text="User Information", font=("", 12, "bold")).grid(
-            row=3, column=0, columnspan=3, sticky=tk.W, pady=(20, 10)
-        )
-        
-        ttk.Label(credentials_frame, text="Phone Number:").grid(
-            row=4, column=0, sticky=tk.W, pady=2
-        )
-        ttk.Entry(credentials_frame, textvariable=self.phone_var, width=40).grid(
-            row=4, column=1, sticky=tk.W, pady=2
-        )
-        
-        ttk.Label(credentials_frame, text="Resume:").grid(
-            row=5, column=0, sticky=tk.W, pady=2
-        )
-        resume_frame = ttk.Frame(credentials_frame)
-        resume_frame.grid(row=5, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Entry(resume_frame, textvariable=self.resume_path_var, width=30).pack(
-            side=tk.LEFT
-        )
-        ttk.Button(resume_frame, text="Browse...", command=lambda: self.browse_file(
-            self.resume_path_var, "Select Resume", [("PDF files", "*.pdf"), ("All files", "*.*")]
-        )).pack(side=tk.LEFT, padx=5)
-        
-        ttk.Label(credentials_frame, text="Cover Letter:").grid(
-            row=6, column=0, sticky=tk.W, pady=2
-        )
-        cover_letter_frame = ttk.Frame(credentials_frame)
-        cover_letter_frame.grid(row=6, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Entry(cover_letter_frame, textvariable=self.cover_letter_path_var, width=30).pack(
-            side=tk.LEFT
-        )
-        ttk.Button(cover_letter_frame, text="Browse...", command=lambda: self.browse_file(
-            self.cover_letter_path_var, "Select Cover Letter", [("PDF files", "*.pdf"), ("All files", "*.*")]
-        )).pack(side=tk.LEFT, padx=5)
-        
-        # Add some space at the bottom
-        ttk.Label(credentials_frame, text="").grid(row=7, column=0, pady=20)
-    
-    def create_search_tab(self) -> None:
+        self._build_rows(credentials_frame, (
+            ("header", "LinkedIn Credentials"),
+            ("entry", "Email:", "email", {}),
+            ("entry", "Password:", "password", {"show": "*"}),
+            ("header", "User Information"),
+            ("entry", "Phone Number:", "phone", {}),
+            ("browse", "Resume:", "resume_path", "Select Resume"),
+            ("browse", "Cover Letter:", "cover_letter_path", "Select Cover Letter"),
+            ("spacer",),
+        ))
+
+    def create_search_tab(self, search_frame: ttk.Frame) -> None:
         """
         Create the search tab.
         """
-        search_frame = ttk.Frame(self.notebook, padding=10)
-        self.notebook.add(search_frame, text="Job Search")
-        
-        # Job search settings
-        ttk.Label(search_frame, text="Job Search Settings", font=("", 12, "bold")).grid(
-            row=0, column=0, columnspan=3, sticky=tk.W, pady=(0, 10)
-        )
-        
-        ttk.Label(search_frame, text="Keywords:").grid(
-            row=1, column=0, sticky=tk.W, pady=2
-        )
-        ttk.Entry(search_frame, textvariable=self.keywords_var, width=40).grid(
-            row=1, column=1, sticky=tk.W, pady=2
-        )
-        
-        ttk.Label(search_frame, text="Location:").grid(
-            row=2, column=0, sticky=tk.W, pady=2
-        )
-        ttk.Entry(search_frame, textvariable=self.location_var, width=40).grid(
-            row=2, column=1, sticky=tk.W, pady=2
-        )
-        
-        ttk.Label(search_frame, text="Max Applications:").grid(
-            row=3, column=0, sticky=tk.W, pady=2
-        )
-        ttk.Spinbox(search_frame, from_=1, to=100, textvariable=self.max_applications_var, width=5).grid(
-            row=3, column=1, sticky=tk.W, pady=2
-        )
-        
-        # Filters
-        ttk.Label(search_frame, text="Filters", font=("", 12, "bold")).grid(
-            row=4, column=0, columnspan=3, sticky=tk.W, pady=(20, 10)
-        )
-        
-        # Easy Apply only checkbox
-        self.easy_apply_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(search_frame, text="Easy Apply Only", variable=self.easy_apply_var).grid(
-            row=5, column=0, sticky=tk.W, pady=2
-        )
-        
-        # Experience level
-        ttk.Label(search_frame, text="Experience Level:").grid(
-            row=6, column=0, sticky=tk.W, pady=2
-        )
-        
-        self.experience_level_var = tk.StringVar(value="All")
-        experience_frame = ttk.Frame(search_frame)
-        experience_frame.grid(row=6, column=1, sticky=tk.W, pady=2)
-        
-        experience_options = ["All", "Internship", "Entry level", "Associate", "Mid-Senior level", "Director", "Executive"]
-        experience_dropdown = ttk.Combobox(experience_frame, textvariable=self.experience_level_var, values=experience_options, width=20)
-        experience_dropdown.pack(side=tk.LEFT)
-        
-        # Job type
-        ttk.Label(search_frame, text="Job Type:").grid(
-            row=7, column=0, sticky=tk.W, pady=2
-        )
-        
-        self.job_type_var = tk.StringVar(value="All")
-        job_type_frame = ttk.Frame(search_frame)
-        job_type_frame.grid(row=7, column=1, sticky=tk.W, pady=2)
-        
-        job_type_options = ["All", "Full-time", "Part-time", "Contract", "Temporary", "Volunteer", "Internship"]
-        job_type_dropdown = ttk.Combobox(job_type_frame, textvariable=self.job_type_var, values=job_type_options, width=20)
-        job_type_dropdown.pack(side=tk.LEFT)
-        
-        # Date posted
-        ttk.Label(search_frame, text="Date Posted:").grid(
-            row=8, column=0, sticky=tk.W, pady=2
-        )
-        
-        self.date_posted_var = tk.StringVar(value="Any time")
-        date_posted_frame = ttk.Frame(search_frame)
-        date_posted_frame.grid(row=8, column=1, sticky=tk.W, pady=2)
-        
-        date_posted_options = ["Any time", "Past 24 hours", "Past week", "Past month"]
-        date_posted_dropdown = ttk.Combobox(date_posted_frame, textvariable=self.date_posted_var, values=date_posted_options, width=20)
-        date_posted_dropdown.pack(side=tk.LEFT)
-        
-        # Add some space at the bottom
-        ttk.Label(search_frame, text="").grid(row=9, column=0, pady=20)
-    
-    def create_settings_tab(self) -> None:
+        self._build_rows(search_frame, (
+            ("header", "Job Search Settings"),
+            ("entry", "Keywords:", "keywords", {}),
+            ("entry", "Location:", "location", {}),
+            ("spin", "Max Applications:", "max_applications",
+             {"from_": 1, "to": 100, "width": 5}),
+            ("header", "Filters"),
+            ("check", "Easy Apply Only", "easy_apply_var", True),
+            ("combo", "Experience Level:", "experience_level",
+             ["All", "Internship", "Entry level", "Associate", "Mid-Senior level", "Director", "Executive"], 20),
+            ("combo", "Job Type:", "job_type",
+             ["All", "Full-time", "Part-time", "Contract", "Temporary", "Volunteer", "Internship"], 20),
+            ("combo", "Date Posted:", "date_posted",
+             ["Any time", "Past 24 hours", "Past week", "Past month"], 20),
+            ("spacer",),
+        ))
+
+    def create_settings_tab(self, settings_frame: ttk.Frame) -> None:
         """
         Create the settings tab.
         """
-        settings_frame = ttk.Frame(self.notebook, padding=10)
-        self.notebook.add(settings_frame, text="Settings")
-        
-        # Browser settings
-        ttk.Label(settings_frame, text="Browser Settings", font=("", 12, "bold")).grid(
-            row=0, column=0, columnspan=3, sticky=tk.W, pady=(0, 10)
-        )
-        
-        ttk.Checkbutton(settings_frame, text="Headless Mode (run browser in background)", variable=self.headless_var).grid(
-            row=1, column=0, columnspan=2, sticky=tk.W, pady=2
-        )
-        
-        # Application settings
-        ttk.Label(settings_frame, text="Application Settings", font=("", 12, "bold")).grid(
-            row=2, column=0, columnspan=3, sticky=tk.W, pady=(20, 10)
-        )
-        
-        # Follow companies checkbox
-        self.follow_companies_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(settings_frame, text="Follow Companies After Applying", variable=self.follow_companies_var).grid(
-            row=3, column=0, columnspan=2, sticky=tk.W, pady=2
-        )
-        
-        # Default answers for common questions
-        ttk.Label(settings_frame, text="Default Answers for Common Questions", font=("", 12, "bold")).grid(
-            row=4, column=0, columnspan=3, sticky=tk.W, pady=(20, 10)
-        )
-        
-        # Years of experience
-        ttk.Label(settings_frame, text="Years of Experience:").grid(
-            row=5, column=0, sticky=tk.W, pady=2
-        )
-        self.years_experience_var = tk.StringVar(value=self.config["application"]["default_answers"]["years_of_experience"])
-        ttk.Entry(settings_frame, textvariable=self.years_experience_var, width=10).grid(
-            row=5, column=1, sticky=tk.W, pady=2
-        )
-        
-        # Education level
-        ttk.Label(settings_frame, text="Education Level:").grid(
-            row=6, column=0, sticky=tk.W, pady=2
-        )
-        self.education_level_var = tk.StringVar(value=self.config["application"]["default_answers"]["education_level"])
-        education_options = ["High School", "Associate's", "Bachelor's", "Master's", "Doctorate"]
-        education_dropdown = ttk.Combobox(settings_frame, textvariable=self.education_level_var, values=education_options, width=15)
-        education_dropdown.grid(row=6, column=1, sticky=tk.W, pady=2)
-        
-        # Willing to relocate
-        ttk.Label(settings_frame, text="Willing to Relocate:").grid(
-            row=7, column=0, sticky=tk.W, pady=2
-        )
-        self.relocate_var = tk.StringVar(value=self.config["application"]["default_answers"]["willing_to_relocate"])
-        relocate_frame = ttk.Frame(settings_frame)
-        relocate_frame.grid(row=7, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Radiobutton(relocate_frame, text="Yes", variable=self.relocate_var, value="Yes").pack(side=tk.LEFT)
-        ttk.Radiobutton(relocate_frame, text="No", variable=self.relocate_var, value="No").pack(side=tk.LEFT, padx=10)
-        
-        # Require sponsorship
-        ttk.Label(settings_frame, text="Require Sponsorship:").grid(
-            row=8, column=0, sticky=tk.W, pady=2
-        )
-        self.sponsorship_var = tk.StringVar(value=self.config["application"]["default_answers"]["require_sponsorship"])
-        sponsorship_frame = ttk.Frame(settings_frame)
-        sponsorship_frame.grid(row=8, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Radiobutton(sponsorship_frame, text="Yes", variable=self.sponsorship_var, value="Yes").pack(side=tk.LEFT)
-        ttk.Radiobutton(sponsorship_frame, text="No", variable=self.sponsorship_var, value="No").pack(side=tk.LEFT, padx=10)
-        
-        # Remote work
-        ttk.Label(settings_frame, text="Remote Work:").grid(
-            row=9, column=0, sticky=tk.W, pady=2
-        )
-        self.remote_work_var = tk.StringVar(value=self.config["application"]["default_answers"]["remote_work"])
-        remote_frame = ttk.Frame(settings_frame)
-        remote_frame.grid(row=9, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Radiobutton(remote_frame, text="Yes", variable=self.remote_work_var, value="Yes").pack(side=tk.LEFT)
-        ttk.Radiobutton(remote_frame, text="No", variable=self.remote_work_var, value="No").pack(side=tk.LEFT, padx=10)
-        
-        # Add some space at the bottom
-        ttk.Label(settings_frame, text="").grid(row=10, column=0, pady=20)
+        default_answers = self.config["application"]["default_answers"]
+        self._build_rows(settings_frame, (
+            ("header", "Browser Settings"),
+            ("check", "Headless Mode (run browser in background)", "headless_var", False),
+            ("header", "Application Settings"),
+            ("check", "Follow Companies After Applying", "follow_companies_var", False),
+            ("header", "Default Answers for Common Questions"),
+            ("entry", "Years of Experience:", "years_experience", {"width": 10}),
+            ("combo", "Education Level:", "education_level",
+             ["High School", "Associate's", "Bachelor's", "Master's", "Doctorate"], 15),
+            ("radio", "Willing to Relocate:", "relocate_var", default_answers["willing_to_relocate"]),
+            ("radio", "Require Sponsorship:", "sponsorship_var", default_answers["require_sponsorship"]),
+            ("radio", "Remote Work:", "remote_work_var", default_answers["remote_work"]),
+            ("spacer",),
+        ))
     
-    def create_log_tab(self) -> None:
+    def create_log_tab(self, log_frame: ttk.Frame) -> None:
         """
         Create the log tab.
         """
-        log_frame = ttk.Frame(self.notebook, padding=10)
-        self.notebook.add(log_frame, text="Log")
-        
-        # Create log text widget with scrollbar
-        self.log_text = tk.Text(log_frame, wrap=tk.WORD, width=80, height=20)
+        # Create log text widget with scrollbar. Word wrap recomputes line
+        # breaks on every insert and the undo stack grows without bound, so
+        # both are off for a log that only ever appends.
+        self.log_text = tk.Text(
+            log_frame, wrap=tk.NONE, undo=False, autoseparators=False,
+            width=80, height=20
+        )
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         scrollbar = ttk.Scrollbar(log_frame, command=self.log_text.yview)
@@ -363,69 +470,96 @@ class LinkedInJobBotGUI:
         self.log_text.config(yscrollcommand=scrollbar.set)
         self.log_text.config(state=tk.DISABLED)  # Make it read-only
     
-    def browse_file(self, var: tk.StringVar, title: str, filetypes: list) -> None:
+    def browse_file(self, key: str, title: str, filetypes: tuple) -> None:
         """
-        Open a file browser dialog and update the variable with the selected file path.
-        
+        Open a file browser dialog and put the selected path into a field.
+
+        The dialog reopens in the directory of the previous selection, so
+        repeat browses don't re-enumerate a large default directory.
+
         Args:
-            var: StringVar to update with the file path.
+            key: Field name to update with the file path.
             title: Dialog title.
-            filetypes: List of file type tuples.
+            filetypes: Tuple of file type tuples.
         """
         filename = filedialog.askopenfilename(
             title=title,
-            filetypes=filetypes
+            filetypes=filetypes,
+            initialdir=self._last_dir or None
         )
         if filename:
-            var.set(filename)
+            entry = self.fields[key]
+            entry.delete(0, tk.END)
+            entry.insert(0, filename)
+            self._last_dir = os.path.dirname(filename)
+
+            # Stat the picked file once, cache the result, and show it inline
+            # so the user sees immediately whether the file is readable.
+            try:
+                size = os.stat(filename).st_size
+            except OSError:
+                size = None
+            self._stat_cache[filename] = size
+            status_label = self._path_labels.get(key)
+            if status_label is not None:
+                if size is None:
+                    status_label.config(text="not found", foreground="red")
+                else:
+                    status_label.config(text=f"{size / 1024:.1f} KB", foreground="green")
     
     def save_settings(self) -> None:
         """
         Save the current settings to the .env file.
         """
+        # Validate the spinbox text before anything is written: the widget
+        # accepts arbitrary typed input, and a non-numeric value saved into
+        # DEFAULT_MAX_APPLICATIONS would break every subsequent config load
+        # until the user hand-edits the .env file.
         try:
-            # Create .env content
-            env_content = f"""# LinkedIn Job Application Bot Configuration
-
-# LinkedIn credentials
-LINKEDIN_EMAIL={self.email_var.get()}
-LINKEDIN_PASSWORD={self.password_var.get()}
-
-# User information
-PHONE_NUMBER={self.phone_var.get()}
-RESUME_PATH={self.resume_path_var.get()}
-COVER_LETTER_PATH={self.cover_letter_path_var.get()}
-
-# Job search settings
-DEFAULT_KEYWORDS={self.keywords_var.get()}
-DEFAULT_LOCATION={self.location_var.get()}
-DEFAULT_MAX_APPLICATIONS={self.max_applications_var.get()}
-
-# Browser settings
-HEADLESS_MODE={str(self.headless_var.get())}
-BROWSER_TIMEOUT=10
-
-# Application settings
-WAIT_TIME_MIN=1.0
-WAIT_TIME_MAX=3.0
-FOLLOW_COMPANIES={str(self.follow_companies_var.get())}
-
-# Output settings
-OUTPUT_DIR=output
-LOG_LEVEL=INFO
-
-# Default answers for application questions
-DEFAULT_YEARS_EXPERIENCE={self.years_experience_var.get()}
-DEFAULT_EDUCATION={self.education_level_var.get()}
-WILLING_TO_RELOCATE={self.relocate_var.get()}
-REQUIRE_SPONSORSHIP={self.sponsorship_var.get()}
-REMOTE_WORK={self.remote_work_var.get()}
-"""
-            
-            # Write to .env file
-            with open(".env", "w") as f:
-                f.write(env_content)
-            
+            max_applications = int(self._field_get("max_applications") or 0)
+        except ValueError:
+            error = f"Max applications must be a number, got: {self._field_get('max_applications')!r}"
+            messagebox.showerror("Configuration Error", error)
+            self.update_log(f"Error: {error}")
+            return
+
+        try:
+            # Fill the precompiled template with the current form values
+            values = {
+                "email": self._field_get("email"),
+                "password": self._field_get("password"),
+                "phone": self._field_get("phone"),
+                "resume_path": self._field_get("resume_path"),
+                "cover_letter_path": self._field_get("cover_letter_path"),
+                "keywords": self._field_get("keywords"),
+                "location": self._field_get("location"),
+                "max_applications": str(max_applications),
+                "headless": str(self.headless_var.get()),
+                "follow_companies": str(self.follow_companies_var.get()),
+                "years_experience": self._field_get("years_experience"),
+                "education_level": self._field_get("education_level"),
+                "relocate": self.relocate_var.get(),
+                "sponsorship": self.sponsorship_var.get(),
+                "remote_work": self.remote_work_var.get(),
+            }
+
+            # Accumulate the file in an in-memory buffer, then write it to
+            # .env atomically in one syscall.
+            buf = io.StringIO()
+            buf.writelines(line.format_map(values) for line in ENV_TEMPLATE_LINES)
+            _write_env_atomic(buf.getvalue())
+
+            # The .env just changed under us: force a re-read that overrides
+            # the existing environment and drops the memoized config and
+            # validation results.
+            refresh_config()
+            self.config = get_config()
+
+            # Validate the freshly saved settings now; the next Start reuses
+            # this result instead of re-checking the files.
+            self._validated_fp = None
+            self._validate_settings()
+
             # Show success message
             messagebox.showinfo("Settings Saved", "Settings have been saved to .env file.")
             
@@ -438,92 +572,202 @@ REMOTE_WORK={self.remote_work_var.get()}
     
     def update_log(self, message: str) -> None:
         """
-        Update the log text widget with a new message.
-        
+        Queue a message for the log text widget.
+
+        Messages are buffered and written to the widget by the periodic
+        flusher, so this is cheap to call from bursts of bot output.
+
         Args:
             message: Message to add to the log.
         """
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)  # Scroll to the end
-        self.log_text.config(state=tk.DISABLED)
+        with self._log_lock:
+            self._log_buf.append(message)
+
+    def _flush_log(self) -> None:
+        """
+        Drain the buffered log messages into the Text widget in one insert.
+        """
+        # The Log tab may not be built yet; leave the messages queued (the
+        # deque's maxlen bounds them) until its widgets exist.
+        if self.log_text is None:
+            self.root.after(100, self._flush_log)
+            return
+
+        with self._log_lock:
+            if self._log_buf:
+                batch = "\n".join(self._log_buf) + "\n"
+                self._log_buf.clear()
+            else:
+                batch = None
+
+        if batch is not None:
+            # Autoscroll only when the user is already at the bottom, so a
+            # reader scrolled back into history isn't yanked to the end and
+            # idle batches don't pay see()'s re-layout.
+            at_bottom = self.log_text.yview()[1] >= 1.0
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, batch)
+            # Trim to the newest MAX_LOG_LINES so widget memory and per-insert
+            # cost stay constant regardless of how long the bot runs.
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > MAX_LOG_LINES:
+                self.log_text.delete('1.0', f'end-{MAX_LOG_LINES + 1}l')
+            if at_bottom:
+                self.log_text.see(tk.END)  # Scroll to the end
+            self.log_text.config(state=tk.DISABLED)
+
+        self.root.after(100, self._flush_log)
     
+    def _settings_fingerprint(self) -> tuple:
+        """
+        Return a tuple of the form values that validation depends on.
+        """
+        return (
+            self._field_get("email"),
+            self._field_get("password"),
+            self._field_get("resume_path"),
+            self._field_get("cover_letter_path"),
+        )
+
+    def _validate_settings(self) -> Optional[str]:
+        """
+        Validate the configuration, reusing the cached result while the
+        fields validation depends on are unchanged.
+
+        Returns:
+            Error message if configuration is invalid, None otherwise.
+        """
+        fingerprint = self._settings_fingerprint()
+        if fingerprint != self._validated_fp:
+            self._validation_error = validate_config()
+            self._validated_fp = fingerprint
+        return self._validation_error
+
     def start_bot(self) -> None:
         """
         Start the LinkedIn job application bot in a separate thread.
         """
-        # Validate settings
-        error = validate_config()
+        # Validate settings; a save or earlier Start with the same field
+        # values already paid for the file checks.
+        error = self._validate_settings()
         if error:
             messagebox.showerror("Configuration Error", error)
             self.update_log(f"Error: {error}")
             return
-        
+
         # Check if bot is already running
-        if self.bot_thread and self.bot_thread.is_alive():
+        if self._bot_future is not None and not self._bot_future.done():
             messagebox.showinfo("Bot Running", "The bot is already running.")
             return
-        
+
+        # Read the form once here on the UI thread — Tk variable and widget
+        # reads are Tcl round-trips and aren't safe from the worker — and
+        # parse it before touching the button state: a ValueError after
+        # disabling Start would leave it stuck on "Running..." forever.
+        keywords = self._field_get("keywords")
+        location = self._field_get("location")
+        try:
+            max_applications = int(self._field_get("max_applications") or 0)
+        except ValueError:
+            error = f"Max applications must be a number, got: {self._field_get('max_applications')!r}"
+            messagebox.showerror("Configuration Error", error)
+            self.update_log(f"Error: {error}")
+            return
+
         # Update UI
         self.start_button.config(text="Running...", state=tk.DISABLED)
         self.update_log("Starting LinkedIn Job Application Bot...")
-        
-        # Create and start bot thread
-        self.bot_thread = threading.Thread(target=self.run_bot)
-        self.bot_thread.daemon = True
-        self.bot_thread.start()
+
+        self._stop.clear()
+        self._bot_future = self._executor.submit(
+            self.run_bot,
+            keywords,
+            location,
+            max_applications,
+            self.headless_var.get(),
+        )
+        self._bot_future.add_done_callback(self._on_bot_done)
     
-    def run_bot(self) -> None:
+    def run_bot(self, keywords: str, location: str, max_applications: int,
+                headless: bool) -> None:
         """
         Run the LinkedIn job application bot.
-        This method is executed in a separate thread.
+        This method is executed in a separate thread; all form values are
+        passed in so the worker never touches Tk state.
+
+        Args:
+            keywords: Job keywords to search for.
+            location: Job location to search for.
+            max_applications: Maximum number of applications to submit.
+            headless: Whether to run the browser in headless mode.
         """
+        # Deferred heavy import: the first run pays the Selenium import cost
+        # here on the worker thread instead of at window startup.
+        if __package__:
+            from .linkedin_job_bot import LinkedInJobBot
+        else:
+            from linkedin_job_bot import LinkedInJobBot
+
+        # Route the bot's log output into the GUI by attaching a handler to
+        # the bot module's logger; its own file/console handlers keep working.
+        bot_logger = logging.getLogger(LinkedInJobBot.__module__)
+        gui_handler = _GuiLogHandler(self)
+        bot_logger.addHandler(gui_handler)
+
         try:
             # Create bot instance
-            self.bot = LinkedInJobBot(headless=self.headless_var.get())
-            
-            # Set up logging to GUI
-            original_info = self.bot.logger.info
-            original_warning = self.bot.logger.warning
-            original_error = self.bot.logger.error
-            
-            def log_to_gui(original_func, message):
-                original_func(message)
-                self.root.after(0, lambda: self.update_log(message))
-            
-            self.bot.logger.info = lambda message: log_to_gui(original_info, message)
-            self.bot.logger.warning = lambda message: log_to_gui(original_warning, message)
-            self.bot.logger.error = lambda message: log_to_gui(original_error, message)
-            
-            # Run the bot
+            self.bot = LinkedInJobBot(headless=headless, stop_event=self._stop)
+
+            # Run the bot. Exceptions propagate into the Future and are
+            # reported by _on_bot_done.
             self.bot.run(
-                keywords=self.keywords_var.get(),
-                location=self.location_var.get(),
-                max_applications=self.max_applications_var.get()
+                keywords=keywords,
+                location=location,
+                max_applications=max_applications
             )
-            
-            # Update UI when done
-            self.root.after(0, lambda: self.update_log("Bot finished running."))
-            self.root.after(0, lambda: self.start_button.config(text="Start Job Application Bot", state=tk.NORMAL))
-        
-        except Exception as e:
-            # Handle any exceptions
-            error_message = f"Error running bot: {str(e)}"
-            self.root.after(0, lambda: self.update_log(error_message))
-            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
-            self.root.after(0, lambda: self.start_button.config(text="Start Job Application Bot", state=tk.NORMAL))
-    
+
+        finally:
+            # Detach so a later run doesn't double-log into the GUI
+            bot_logger.removeHandler(gui_handler)
+
+    def _on_bot_done(self, future: concurrent.futures.Future) -> None:
+        """
+        Report the finished run and re-enable the Start button.
+
+        Runs on the worker thread as the Future's done callback; UI changes
+        are dispatched to the UI thread, and update_log only appends to the
+        thread-safe buffer that the periodic pump flushes.
+
+        Args:
+            future: The completed Future for the bot run.
+        """
+        error = future.exception()
+        if error is None:
+            self.update_log("Bot finished running.")
+        else:
+            error_message = f"Error running bot: {str(error)}"
+            self.update_log(error_message)
+            self.root.after(0, functools.partial(messagebox.showerror, "Error", error_message))
+        self.root.after(0, functools.partial(
+            self.start_button.config, text="Start Job Application Bot", state=tk.NORMAL
+        ))
+
     def on_close(self) -> None:
         """
         Handle window close event.
         """
         # Check if bot is running
-        if self.bot_thread and self.bot_thread.is_alive():
+        if self._bot_future is not None and not self._bot_future.done():
             if messagebox.askyesno("Quit", "The bot is still running. Are you sure you want to quit?"):
-                # Force quit
+                # Ask the worker to stop and give it a moment to close the
+                # browser before tearing the window down.
+                self._stop.set()
+                concurrent.futures.wait([self._bot_future], timeout=10)
+                self._executor.shutdown(wait=False, cancel_futures=True)
                 self.root.destroy()
         else:
             # Normal quit
+            self._executor.shutdown(wait=False)
             self.root.destroy()
 
 
@@ -9,16 +9,26 @@ It logs in to LinkedIn, searches for jobs with specified criteria, and applies t
 jobs with the "Easy Apply" button.
 """
 
+import atexit
+import concurrent.futures
+import itertools
+import json
 import os
+import queue
+import signal
+import subprocess
+import sys
+import tempfile
 import time
 import csv
 import logging
+import logging.handlers
 import random
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -27,41 +37,288 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
-    TimeoutException, 
-    NoSuchElementException, 
+    TimeoutException,
+    NoSuchElementException,
     ElementClickInterceptedException,
+    SessionNotCreatedException,
     StaleElementReferenceException
 )
 from webdriver_manager.chrome import ChromeDriverManager
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Works both as a package module and as a standalone script. Importing
+# config loads the .env once (through its pickle snapshot), so this module
+# does not call load_dotenv itself.
+try:
+    from .utils import Locator, _SET_VALUE_JS
+    from .config import ensure_output_dir
+except ImportError:
+    from utils import Locator, _SET_VALUE_JS
+    from config import ensure_output_dir
 
-# Configure logging
+# Configure logging. The file handler sits behind a MemoryHandler so log
+# records are flushed to disk in batches instead of one write() per line;
+# errors flush immediately and logging.shutdown() flushes the rest on exit.
+_file_handler = logging.FileHandler("linkedin_bot.log")
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler("linkedin_bot.log"),
+        logging.handlers.MemoryHandler(256, flushLevel=logging.ERROR, target=_file_handler),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Cached chromedriver path, keyed by the local Chrome version so repeat runs
+# skip webdriver-manager's network version check and potential download
+_DRIVER_CACHE = Path.home() / ".cache" / "linkedin_bot" / "chromedriver_path"
+
+# Persistent Chrome profiles live next to the driver cache so LinkedIn's
+# auth cookies survive between runs and verify_login passes without typing
+# credentials. Chrome locks a user-data-dir per running instance, so each
+# additional session in this process (the parallel-apply workers) gets its
+# own numbered directory off this counter; the first session always takes
+# the unnumbered one and therefore reuses it run after run.
+_PROFILE_BASE = Path.home() / ".cache" / "linkedin_bot" / "chrome_profile"
+_PROFILE_SEQ = itertools.count()
+
+# Per-process sequence for output filenames. Timestamp plus pid is not
+# unique once several bots live in one process (parallel workers, the
+# session pool): same pid, and two instances created within the same
+# second would open the same CSV. Each instance appends its own number.
+_OUTPUT_SEQ = itertools.count()
+
+
+def _chrome_version() -> str:
+    """
+    Return the local Chrome/Chromium version string, or "" if not found.
+    """
+    for exe in ("google-chrome", "google-chrome-stable", "chromium-browser", "chromium"):
+        try:
+            result = subprocess.run(
+                [exe, "--version"], capture_output=True, text=True, timeout=10
+            )
+        except OSError:
+            continue
+        if result.returncode == 0:
+            return result.stdout.strip()
+    return ""
+
+
+def _resolve_chromedriver() -> str:
+    """
+    Resolve the chromedriver binary path, avoiding the manager when possible.
+
+    Order: the CHROMEDRIVER_PATH environment variable, then a cache file
+    recorded on a previous run (honored while the local Chrome version is
+    unchanged), and only then ChromeDriverManager().install(), whose HTTPS
+    version check adds seconds to every cold start.
+
+    Returns:
+        Path to the chromedriver binary.
+    """
+    env_path = os.environ.get("CHROMEDRIVER_PATH")
+    if env_path and os.path.exists(env_path):
+        return env_path
+
+    version = _chrome_version()
+    try:
+        cached_version, cached_path = _DRIVER_CACHE.read_text().splitlines()[:2]
+        if cached_version == version and os.path.exists(cached_path):
+            return cached_path
+    except (OSError, ValueError):
+        pass
+
+    path = ChromeDriverManager().install()
+    try:
+        _DRIVER_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _DRIVER_CACHE.write_text(f"{version}\n{path}\n")
+    except OSError:
+        pass
+    return path
+
+
+# Canonical locator registry keyed by semantic name. Each entry is a frozen
+# Locator built once at module scope: it unpacks like the (By, selector)
+# tuples the Selenium waits and clicks expect, while carrying the
+# precomputed in-page query string the CDP probes use — one source, no
+# per-call conversion.
+_DEFAULT_LOCATORS: Dict[str, Locator] = {
+    "keywords_input": Locator(By.CSS_SELECTOR, "input[aria-label='Search by title, skill, or company']"),
+    "location_input": Locator(By.CSS_SELECTOR, "input[aria-label='City, state, or zip code']"),
+    "search_button": Locator(By.CSS_SELECTOR, "button[data-tracking-control-name='public_jobs_jobs-search-bar_base-search-button']"),
+    "search_results": Locator(By.CSS_SELECTOR, ".jobs-search-results"),
+    "filters_button": Locator(By.CSS_SELECTOR, "button[aria-label='Filter by']"),
+    "filter_modal": Locator(By.CSS_SELECTOR, ".artdeco-modal"),
+    "easy_apply_filter": Locator(By.XPATH, "//label[contains(., 'Easy Apply')]"),
+    "show_results_button": Locator(By.CSS_SELECTOR, "button[data-control-name='filter_pill_apply']"),
+    "easy_apply_btn": Locator(By.CSS_SELECTOR, "button[data-control-name='jobdetails_topcard_inapply']"),
+    "easy_apply_modal": Locator(By.CSS_SELECTOR, ".jobs-easy-apply-content"),
+    "review_btn": Locator(By.CSS_SELECTOR, "button[aria-label='Review your application']"),
+    "submit_btn": Locator(By.CSS_SELECTOR, "button[aria-label='Submit application']"),
+    "next_btn": Locator(By.CSS_SELECTOR, "button[aria-label='Continue to next step']"),
+    "dismiss_btn": Locator(By.CSS_SELECTOR, "button[aria-label='Dismiss']"),
+    "discard_confirm_btn": Locator(By.CSS_SELECTOR, "button[data-control-name='discard_application_confirm_btn']"),
+    "error_fields": Locator(By.CSS_SELECTOR, ".artdeco-text-input--error"),
+    "phone_inputs": Locator(By.CSS_SELECTOR, "input[type='tel']"),
+    "file_inputs": Locator(By.CSS_SELECTOR, "input[type='file']"),
+    "follow_checkbox": Locator(By.CSS_SELECTOR, "label[for='follow-company-checkbox']"),
+}
+
+
+def _load_locators() -> Dict[str, Locator]:
+    """
+    Build the locator registry, applying overrides from a JSON file.
+
+    When LinkedIn changes its DOM, selectors can be patched by dropping a
+    JSON file next to the bot (path from the LOCATORS_FILE environment
+    variable, default "locators.json") instead of editing code. Values are
+    either a bare CSS selector string or a [by, selector] pair.
+
+    Returns:
+        Mapping of semantic name to Locator.
+    """
+    locators = dict(_DEFAULT_LOCATORS)
+    override_path = os.getenv("LOCATORS_FILE", "locators.json")
+    try:
+        with open(override_path, encoding="utf-8") as f:
+            overrides = json.load(f)
+    except OSError:
+        return locators
+    except ValueError as e:
+        logger.warning(f"Ignoring invalid locator overrides in {override_path}: {e}")
+        return locators
+
+    for name, value in overrides.items():
+        if isinstance(value, str):
+            locators[name] = Locator(By.CSS_SELECTOR, value)
+        else:
+            locators[name] = Locator(value[0], value[1])
+    logger.info(f"Loaded locator overrides from {override_path}")
+    return locators
+
+
+LOCATORS = _load_locators()
+
+# Short aliases for the hot-path registry entries used inside the step loop
+EASY_APPLY_BTN = LOCATORS["easy_apply_btn"]
+EASY_APPLY_MODAL = LOCATORS["easy_apply_modal"]
+REVIEW_BTN = LOCATORS["review_btn"]
+SUBMIT_BTN = LOCATORS["submit_btn"]
+NEXT_BTN = LOCATORS["next_btn"]
+DISMISS_BTN = LOCATORS["dismiss_btn"]
+DISCARD_CONFIRM_BTN = LOCATORS["discard_confirm_btn"]
+ERROR_FIELDS = LOCATORS["error_fields"]
+PHONE_INPUTS = LOCATORS["phone_inputs"]
+FILE_INPUTS = LOCATORS["file_inputs"]
+FOLLOW_CHECKBOX = LOCATORS["follow_checkbox"]
+
+# Extracts every visible job card's metadata in one in-page call. A single
+# execute_script round-trip replaces the click plus four or five find_element
+# round-trips per card that each cost a full WebDriver protocol hop.
+CARD_EXTRACT_JS = """
+    const text = (el, sel) => {
+        const node = el.querySelector(sel);
+        return node ? node.innerText.trim() : '';
+    };
+    return Array.from(
+        document.querySelectorAll('.jobs-search-results__list-item')
+    ).map(el => {
+        const link = el.querySelector('a');
+        return {
+            title: text(el, '.job-card-list__title') || text(el, 'a'),
+            company: text(el, '.job-card-container__company-name'),
+            location: text(el, '.job-card-container__metadata-item'),
+            url: link ? link.href : '',
+            has_easy_apply: !!el.querySelector('.job-card-container__apply-method')
+        };
+    });
+"""
+
+
+# Scrolls to the bottom and resolves with the new document height once the
+# page has grown (or after a 3s deadline). Run through execute_async_script,
+# it folds the scroll call and the height polling into one round-trip instead
+# of a scrollTo plus repeated scrollHeight reads from Python.
+SCROLL_GROW_JS = """
+    const done = arguments[arguments.length - 1];
+    const lastHeight = arguments[0];
+    window.scrollTo(0, document.body.scrollHeight);
+    const deadline = Date.now() + 3000;
+    const poll = () => {
+        const height = document.body.scrollHeight;
+        if (height > lastHeight || Date.now() > deadline) {
+            done(height);
+        } else {
+            setTimeout(poll, 100);
+        }
+    };
+    poll();
+"""
+
+# One-shot wait for an element to appear. A MutationObserver resolves the
+# callback the instant a matching node lands in the DOM, where a WebDriverWait
+# at its poll interval issues a round-trip query every 100-500ms and still
+# only notices the element at the next poll boundary. Run through
+# execute_async_script; resolves true/false on appearance/timeout.
+AWAIT_DOM_JS = """
+    const css = arguments[0];
+    const timeoutMs = arguments[1];
+    const done = arguments[arguments.length - 1];
+    if (document.querySelector(css)) {
+        return done(true);
+    }
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(css)) {
+            observer.disconnect();
+            clearTimeout(timer);
+            done(true);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        done(false);
+    }, timeoutMs);
+    observer.observe(document.body, {childList: true, subtree: true});
+"""
 
 class LinkedInJobBot:
     """
     A bot that automates applying to jobs on LinkedIn.
     """
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, stop_event: Optional[threading.Event] = None,
+                 parallel_sessions: int = 1, rate_per_min: float = 12.0):
         """
         Initialize the LinkedIn Job Bot.
-        
+
         Args:
             headless: Whether to run the browser in headless mode.
+            stop_event: Optional event checked between jobs; setting it asks
+                the bot to stop cooperatively so the browser shuts down
+                cleanly instead of being killed with its thread.
+            parallel_sessions: Number of independent Chrome sessions used
+                for the apply phase. Applications are mostly network wait,
+                so extra sessions overlap those waits; 1 keeps the serial
+                single-browser flow.
+            rate_per_min: Target applications per minute. Pacing between
+                applications sleeps only for whatever is left of this
+                budget after the application itself, instead of a fixed
+                random delay.
         """
+        # Deferred so importing this module doesn't pull in utils' heavier
+        # dependencies on the startup path
+        try:
+            from .utils import TokenBucket
+        except ImportError:
+            from utils import TokenBucket
+
+        self.stop_event = stop_event if stop_event is not None else threading.Event()
+        self.headless = headless
+        self.parallel_sessions = max(1, parallel_sessions)
+        self.rate_per_min = rate_per_min
+        self._bucket = TokenBucket(rate_per_min)
         self.email = os.getenv("LINKEDIN_EMAIL")
         self.password = os.getenv("LINKEDIN_PASSWORD")
         self.phone_number = os.getenv("PHONE_NUMBER", "")
@@ -71,22 +328,175 @@ class LinkedInJobBot:
             raise ValueError("LinkedIn email and password must be set in environment variables.")
         
         self.driver = self._setup_driver(headless)
-        self.wait = WebDriverWait(self.driver, 10)
-        self.applications_data = []
-        
-        # Create output directory if it doesn't exist
-        Path("output").mkdir(exist_ok=True)
+
+        # One reusable wait per timeout tier. Implicit waiting is disabled in
+        # _setup_driver, so lookups never compound an implicit timeout on top
+        # of these; the tighter poll intervals notice elements well before
+        # Selenium's default 500ms poll would.
+        self.wait_short = WebDriverWait(self.driver, 2, poll_frequency=0.1)
+        self.wait = WebDriverWait(self.driver, 10, poll_frequency=0.25)
+        self.wait_long = WebDriverWait(self.driver, 30, poll_frequency=0.5)
+
+        # Application log kept as parallel column lists (one per CSV field)
+        # rather than a list of per-row dicts. A list slot costs ~56 bytes
+        # where each row dict rebuilt its seven string keys at ~232 bytes,
+        # and the columns feed the summary workbook directly with no
+        # row-to-column conversion at the end.
+        self._col_titles: List[str] = []
+        self._col_companies: List[str] = []
+        self._col_locations: List[str] = []
+        self._col_statuses: List[str] = []
+        self._col_dates: List[str] = []
+        self._col_urls: List[str] = []
+        self._col_notes: List[str] = []
         
-        # Initialize CSV file with headers if it doesn't exist
-        self.csv_path = f"output/applications_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        if not os.path.exists(self.csv_path):
-            with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'Job Title', 'Company', 'Location', 'Application Status', 
-                    'Application Date', 'Job URL', 'Notes'
-                ])
+        # Create the configured output directory (OUTPUT_DIR) if it doesn't exist
+        self.output_dir = ensure_output_dir()
+
+        # Open the applications CSV once and keep the handle; per-row appends
+        # then cost a buffered write instead of an open/close pair each time.
+        # The timestamp, pid, and per-instance sequence number make the name
+        # unique even when several bots start within the same second in the
+        # same process, so the header goes in unconditionally with no
+        # exists() probe. Closed in run()'s cleanup.
+        self._output_seq = next(_OUTPUT_SEQ)
+        self.csv_path = str(
+            self.output_dir
+            / (f"applications_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+               f"_pid{os.getpid()}_{self._output_seq}.csv")
+        )
+        self._csv_fh = open(self.csv_path, 'w', newline='', encoding='utf-8')
+        self._csv_writer = csv.writer(self._csv_fh)
+        self._csv_writer.writerow([
+            'Job Title', 'Company', 'Location', 'Application Status',
+            'Application Date', 'Job URL', 'Notes'
+        ])
+
+        # Make sure the browser dies with the process. A leaked chromedriver
+        # plus its Chrome children holds hundreds of MB each, so close() is
+        # hooked into normal interpreter exit and SIGTERM as well as the
+        # context-manager/run() paths. Signal handlers can only be installed
+        # from the main thread (the GUI constructs the bot on a worker).
+        self._closed = False
+        atexit.register(self.close)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._handle_sigterm)
+
+    def __enter__(self) -> "LinkedInJobBot":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Quit the browser and close the applications CSV.
+
+        Idempotent, so the context manager, run()'s cleanup, atexit, and the
+        SIGTERM handler can all call it without tripping over each other.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.driver.quit()
+        finally:
+            self._csv_fh.close()
+
+    def _handle_sigterm(self, signum, frame) -> None:
+        logger.info("Received SIGTERM. Closing browser...")
+        self.close()
+        sys.exit(0)
     
+    def _wait_for(self, css: str, wait: Optional[WebDriverWait] = None):
+        """
+        Wait for an element to be present and return it.
+
+        Uses the preconstructed wait tiers instead of building an ad-hoc
+        WebDriverWait (with its slower default poll) per call.
+
+        Args:
+            css: CSS selector of the element to await.
+            wait: Wait tier to use; defaults to the standard self.wait.
+
+        Returns:
+            The located WebElement.
+        """
+        return (wait or self.wait).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, css))
+        )
+
+    def _await_step_change(self, prev_root) -> None:
+        """
+        Wait for the Easy Apply modal to mount the next step.
+
+        Waits on staleness of the previous step's root element instead of
+        sleeping a fixed interval, returning as soon as the DOM has actually
+        swapped; a small random jitter is kept for anti-detection.
+
+        Args:
+            prev_root: Root element of the step that was just advanced past,
+                or None to only jitter.
+        """
+        if prev_root is not None:
+            try:
+                WebDriverWait(self.driver, 5).until(EC.staleness_of(prev_root))
+            except TimeoutException:
+                pass
+        time.sleep(random.uniform(0.1, 0.3))
+
+    def _cdp_query(self, css: str) -> int:
+        """
+        Count elements matching a CSS selector via the DevTools protocol.
+
+        Runtime.evaluate travels over chromedriver's CDP WebSocket rather
+        than the WebDriver HTTP path, so a presence probe costs a fraction
+        of a find_elements round-trip. Probes only — clicks and attribute
+        reads stay on WebDriver for its interaction semantics.
+
+        Args:
+            css: CSS selector to count matches for.
+
+        Returns:
+            Number of matching elements.
+        """
+        result = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": f"document.querySelectorAll({css!r}).length",
+            "returnByValue": True,
+        })
+        return result.get("result", {}).get("value", 0)
+
+    def _fast_type(self, element, text: str) -> None:
+        """
+        Fill a text input with a single script call instead of send_keys.
+
+        Uses the shared native-setter script from utils: a plain
+        ``element.value = ...`` assignment is swallowed by React's value
+        tracker, so the value is set through the prototype setter before the
+        input/change events fire.
+
+        Args:
+            element: The input WebElement to fill.
+            text: The text to set as the input's value.
+        """
+        self.driver.execute_script(_SET_VALUE_JS, element, text)
+
+    def _await_dom(self, css: str, timeout_ms: int = 10000) -> bool:
+        """
+        Wait for an element to appear using an in-page MutationObserver.
+
+        One execute_async_script call replaces the explicit wait's repeated
+        poll queries, and fires as soon as the DOM actually changes.
+
+        Args:
+            css: CSS selector to wait for.
+            timeout_ms: Maximum time to wait, in milliseconds.
+
+        Returns:
+            True if a matching element appeared before the timeout.
+        """
+        return bool(self.driver.execute_async_script(AWAIT_DOM_JS, css, timeout_ms))
+
     def _setup_driver(self, headless: bool) -> webdriver.Chrome:
         """
         Set up the Chrome WebDriver.
@@ -107,12 +517,63 @@ class LinkedInJobBot:
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument("--disable-notifications")
-        
+
+        # Skip resources the bot never looks at: images dominate LinkedIn
+        # page weight, and background services burn CPU/memory per session.
+        # Stylesheets stay enabled since the CSS selectors rely on layout.
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-features=Translate,MediaRouter")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+
+        # Reuse a persistent profile so the LinkedIn session cookie carries
+        # over between invocations; after the first run verify_login sees
+        # the feed immediately instead of replaying the ~10s login flow.
+        # The counter only deduplicates sessions within this process; a
+        # concurrent process (the daemon, a second CLI run) may already hold
+        # the same directory, which Chrome hard-fails on — that case falls
+        # back to an ephemeral profile below.
+        index = next(_PROFILE_SEQ)
+        profile_dir = _PROFILE_BASE if index == 0 else Path(f"{_PROFILE_BASE}_{index}")
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument("--profile-directory=Default")
+
+        # Return from driver.get() on DOMContentLoaded instead of waiting
+        # for every subresource; the explicit waits cover the rest
+        chrome_options.page_load_strategy = "eager"
+
         # Add user agent to avoid detection
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
         
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        service = Service(_resolve_chromedriver())
+        try:
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        except SessionNotCreatedException as e:
+            if "user data directory" not in str(e):
+                raise
+            # Another process has the profile locked. Retry once with a
+            # throwaway profile: the session cookie is lost (login replays),
+            # but the run proceeds instead of dying at driver startup.
+            temp_profile = tempfile.mkdtemp(prefix="linkedin_bot_profile_")
+            logger.warning(
+                f"Chrome profile {profile_dir} is in use by another process; "
+                f"falling back to temporary profile {temp_profile}"
+            )
+            chrome_options.arguments.remove(f"--user-data-dir={profile_dir}")
+            chrome_options.add_argument(f"--user-data-dir={temp_profile}")
+            driver = webdriver.Chrome(service=Service(_resolve_chromedriver()),
+                                      options=chrome_options)
+
+        # All waiting is explicit; an implicit wait would stack onto every
+        # find_elements() probe and turn a missing element into a silent
+        # multi-second stall
+        driver.implicitly_wait(0)
         return driver
     
     def login(self) -> bool:
@@ -137,8 +598,10 @@ class LinkedInJobBot:
             # Click login button
             self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
             
-            # Wait for login to complete
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".feed-identity-module")))
+            # Wait for login to complete. This is the one genuinely slow
+            # transition (server-side auth plus a full feed page load), so it
+            # gets the long tier rather than the standard 10s wait.
+            self.wait_long.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".feed-identity-module")))
             
             logger.info("Successfully logged in to LinkedIn")
             return True
@@ -214,54 +677,52 @@ class LinkedInJobBot:
             
             # Clear and enter keywords
             keywords_input = self.wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "input[aria-label='Search by title, skill, or company']")
+                LOCATORS["keywords_input"]
             ))
-            keywords_input.clear()
-            keywords_input.send_keys(keywords)
-            
+            self._fast_type(keywords_input, keywords)
+
             # Clear and enter location
             location_input = self.wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "input[aria-label='City, state, or zip code']")
+                LOCATORS["location_input"]
             ))
-            location_input.clear()
-            location_input.send_keys(location)
-            
+            self._fast_type(location_input, location)
+
             # Click search button
             search_button = self.wait.until(EC.element_to_be_clickable(
-                (By.CSS_SELECTOR, "button[data-tracking-control-name='public_jobs_jobs-search-bar_base-search-button']")
+                LOCATORS["search_button"]
             ))
             search_button.click()
-            
+
             # Wait for search results to load
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-search-results")))
-            
+            self.wait.until(EC.presence_of_element_located(LOCATORS["search_results"]))
+
             # Apply Easy Apply filter if requested
             if easy_apply_only:
                 logger.info("Applying 'Easy Apply' filter...")
                 try:
                     # Click on the filters button
                     filters_button = self.wait.until(EC.element_to_be_clickable(
-                        (By.CSS_SELECTOR, "button[aria-label='Filter by']")
+                        LOCATORS["filters_button"]
                     ))
                     filters_button.click()
-                    
+
                     # Wait for filter modal to appear
-                    self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".artdeco-modal")))
-                    
+                    self.wait.until(EC.presence_of_element_located(LOCATORS["filter_modal"]))
+
                     # Click on Easy Apply checkbox
                     easy_apply_checkbox = self.wait.until(EC.element_to_be_clickable(
-                        (By.XPATH, "//label[contains(., 'Easy Apply')]")
+                        LOCATORS["easy_apply_filter"]
                     ))
                     easy_apply_checkbox.click()
-                    
+
                     # Click on Show results button
                     show_results_button = self.wait.until(EC.element_to_be_clickable(
-                        (By.CSS_SELECTOR, "button[data-control-name='filter_pill_apply']")
+                        LOCATORS["show_results_button"]
                     ))
                     show_results_button.click()
-                    
+
                     # Wait for filtered results to load
-                    self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-search-results")))
+                    self.wait.until(EC.presence_of_element_located(LOCATORS["search_results"]))
                     
                 except (TimeoutException, NoSuchElementException, ElementClickInterceptedException) as e:
                     logger.warning(f"Failed to apply Easy Apply filter: {str(e)}")
@@ -273,13 +734,18 @@ class LinkedInJobBot:
             logger.error(f"Failed to search for jobs: {str(e)}")
             return False
     
-    def scroll_through_jobs(self, max_jobs: int = 100) -> List[Dict]:
+    def scroll_through_jobs(self, max_jobs: int = 100,
+                            on_job: Optional[Callable[[Dict, int], None]] = None) -> List[Dict]:
         """
         Scroll through job listings and collect job data.
-        
+
         Args:
             max_jobs: Maximum number of jobs to collect.
-            
+            on_job: Optional callback invoked with (job_data, dom_index) for
+                each newly collected Easy Apply card, letting run() apply
+                from the already-rendered list instead of re-navigating to
+                each job afterwards.
+
         Returns:
             List of job data dictionaries.
         """
@@ -298,42 +764,30 @@ class LinkedInJobBot:
         # Scroll and collect job data
         last_height = self.driver.execute_script("return document.body.scrollHeight")
         job_count = 0
-        
-        while job_count < max_jobs:
-            # Get current job cards
-            try:
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, job_cards_selector)
-            except NoSuchElementException:
-                break
-            
-            # Process new job cards
-            for i in range(job_count, min(len(job_cards), max_jobs)):
-                try:
-                    # Scroll to the job card
-                    self.driver.execute_script("arguments[0].scrollIntoView();", job_cards[i])
-                    time.sleep(random.uniform(0.5, 1.5))  # Random delay to avoid detection
-                    
-                    # Click on the job card to view details
-                    job_cards[i].click()
-                    time.sleep(random.uniform(1.0, 2.0))  # Wait for job details to load
-                    
-                    # Extract job data
-                    job_data = self._extract_job_data()
-                    if job_data:
-                        job_listings.append(job_data)
-                        job_count += 1
-                        logger.info(f"Collected job {job_count}/{max_jobs}: {job_data['title']} at {job_data['company']}")
-                
-                except (StaleElementReferenceException, ElementClickInterceptedException, NoSuchElementException) as e:
-                    logger.warning(f"Error processing job card {i}: {str(e)}")
+        seen_urls = set()
+
+        while job_count < max_jobs and not self.stop_event.is_set():
+            # Read every visible card in one in-page call; the URL set skips
+            # cards already collected on a previous scroll pass
+            for dom_index, job_data in enumerate(self.driver.execute_script(CARD_EXTRACT_JS) or []):
+                if job_count >= max_jobs:
+                    break
+                url = job_data.get("url")
+                if not url or url in seen_urls:
                     continue
-            
-            # Scroll down to load more jobs
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(random.uniform(1.0, 2.0))  # Wait for new content to load
-            
+                seen_urls.add(url)
+                job_listings.append(job_data)
+                job_count += 1
+                logger.info(f"Collected job {job_count}/{max_jobs}: {job_data['title']} at {job_data['company']}")
+
+                if on_job is not None and job_data.get("has_easy_apply", False):
+                    on_job(job_data, dom_index)
+
+            # Scroll down and wait in-page for the document to grow; one
+            # async round-trip whose deadline doubles as end-of-list detection
+            new_height = self.driver.execute_async_script(SCROLL_GROW_JS, last_height)
+
             # Check if we've reached the end of the page
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
             if new_height == last_height:
                 # Try clicking "Show more jobs" button if available
                 try:
@@ -341,7 +795,7 @@ class LinkedInJobBot:
                         By.CSS_SELECTOR, "button.infinite-scroller__show-more-button"
                     )
                     show_more_button.click()
-                    time.sleep(random.uniform(1.0, 2.0))
+                    new_height = self.driver.execute_async_script(SCROLL_GROW_JS, last_height)
                 except NoSuchElementException:
                     logger.info("Reached end of job listings")
                     break
@@ -351,89 +805,38 @@ class LinkedInJobBot:
         logger.info(f"Collected {len(job_listings)} job listings")
         return job_listings
     
-    def _extract_job_data(self) -> Optional[Dict]:
-        """
-        Extract job data from the current job details page.
-        
-        Returns:
-            Dictionary containing job data, or None if extraction failed.
-        """
-        try:
-            # Wait for job details to load
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-unified-top-card")))
-            
-            # Extract job title
-            title_element = self.driver.find_element(
-                By.CSS_SELECTOR, ".jobs-unified-top-card__job-title"
-            )
-            title = title_element.text.strip()
-            
-            # Extract company name
-            company_element = self.driver.find_element(
-                By.CSS_SELECTOR, ".jobs-unified-top-card__company-name"
-            )
-            company = company_element.text.strip()
-            
-            # Extract location
-            location_element = self.driver.find_element(
-                By.CSS_SELECTOR, ".jobs-unified-top-card__bullet"
-            )
-            location = location_element.text.strip()
-            
-            # Check if Easy Apply button exists
-            try:
-                easy_apply_button = self.driver.find_element(
-                    By.CSS_SELECTOR, "button[data-control-name='jobdetails_topcard_inapply']"
-                )
-                has_easy_apply = True
-            except NoSuchElementException:
-                has_easy_apply = False
-            
-            # Get job URL
-            job_url = self.driver.current_url
-            
-            return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "has_easy_apply": has_easy_apply,
-                "url": job_url
-            }
-        
-        except (TimeoutException, NoSuchElementException) as e:
-            logger.warning(f"Failed to extract job data: {str(e)}")
-            return None
-    
-    def apply_to_job(self, job_data: Dict) -> Tuple[bool, str]:
+    def apply_to_job(self, job_data: Dict, navigate: bool = True) -> Tuple[bool, str]:
         """
         Apply to a job using Easy Apply.
-        
+
         Args:
             job_data: Dictionary containing job data.
-            
+            navigate: Load the job URL first. Pass False when the job's
+                detail pane is already on screen (the fused collect-and-apply
+                pass), which skips a full page load per application.
+
         Returns:
             Tuple of (success status, notes).
         """
         if not job_data.get("has_easy_apply", False):
             return False, "Not an Easy Apply job"
-        
+
         try:
             logger.info(f"Applying to job: {job_data['title']} at {job_data['company']}")
-            
-            # Navigate to the job URL
-            self.driver.get(job_data["url"])
-            
+
+            # Navigate to the job URL unless the pane is already displayed
+            if navigate:
+                self.driver.get(job_data["url"])
+
             # Wait for page to load
             self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-unified-top-card")))
             
             # Click Easy Apply button
-            easy_apply_button = self.wait.until(EC.element_to_be_clickable(
-                (By.CSS_SELECTOR, "button[data-control-name='jobdetails_topcard_inapply']")
-            ))
+            easy_apply_button = self.wait.until(EC.element_to_be_clickable(EASY_APPLY_BTN))
             easy_apply_button.click()
             
             # Wait for application modal to appear
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-easy-apply-content")))
+            self.wait.until(EC.presence_of_element_located(EASY_APPLY_MODAL))
             
             # Process application steps
             return self._process_application_steps()
@@ -455,25 +858,35 @@ class LinkedInJobBot:
         
         while current_step <= max_steps:
             try:
-                # Check if we're on the review step
-                review_button = self.driver.find_elements(
-                    By.CSS_SELECTOR, "button[aria-label='Review your application']"
+                # Root element of the current modal step; used to detect when
+                # a click has swapped in the next step's DOM
+                step_roots = self.driver.find_elements(*EASY_APPLY_MODAL)
+                step_root = step_roots[0] if step_roots else None
+
+                # One MutationObserver wait resolves as soon as whichever
+                # modal control appears next lands in the DOM, instead of
+                # a polled composite wait against a still-rendering step.
+                # A timeout just falls through to the probes below.
+                self._await_dom(
+                    f"{REVIEW_BTN.selector}, {SUBMIT_BTN.selector}, {NEXT_BTN.selector}",
+                    timeout_ms=2000,
                 )
-                if review_button:
+
+                # Check if we're on the review step (CDP probe, WebDriver click)
+                if self._cdp_query(REVIEW_BTN.selector):
                     logger.info("Reviewing application...")
-                    review_button[0].click()
-                    time.sleep(random.uniform(1.0, 2.0))
-                
+                    self.driver.find_element(*REVIEW_BTN).click()
+                    self._await_step_change(step_root)
+
                 # Check if we're on the submit step
-                submit_button = self.driver.find_elements(
-                    By.CSS_SELECTOR, "button[aria-label='Submit application']"
-                )
-                if submit_button:
+                has_submit = bool(self._cdp_query(SUBMIT_BTN.selector))
+                if has_submit:
                     logger.info("Submitting application...")
-                    submit_button[0].click()
+                    self.driver.find_element(*SUBMIT_BTN).click()
                     
-                    # Wait for confirmation
-                    self.wait.until(EC.presence_of_element_located(
+                    # Wait for confirmation; submission is a server round
+                    # trip that can outlast the standard tier.
+                    self.wait_long.until(EC.presence_of_element_located(
                         (By.CSS_SELECTOR, ".artdeco-modal__content")
                     ))
                     
@@ -485,9 +898,7 @@ class LinkedInJobBot:
                         logger.info("Application submitted successfully")
                         
                         # Close the confirmation dialog
-                        close_button = self.driver.find_element(
-                            By.CSS_SELECTOR, "button[aria-label='Dismiss']"
-                        )
+                        close_button = self.driver.find_element(*DISMISS_BTN)
                         close_button.click()
                         
                         return True, "Application submitted successfully"
@@ -496,11 +907,8 @@ class LinkedInJobBot:
                         notes.append("Submission status unclear")
                 
                 # Check for any required fields
-                required_fields = self.driver.find_elements(
-                    By.CSS_SELECTOR, ".artdeco-text-input--error"
-                )
-                if required_fields:
-                    for field in required_fields:
+                if self._cdp_query(ERROR_FIELDS.selector):
+                    for field in self.driver.find_elements(*ERROR_FIELDS):
                         field_id = field.get_attribute("id")
                         label_element = self.driver.find_element(
                             By.CSS_SELECTOR, f"label[for='{field_id}']"
@@ -511,63 +919,53 @@ class LinkedInJobBot:
                     logger.warning(f"Application has required fields: {', '.join(notes)}")
                     
                     # Try to fill in phone number if it's required
-                    phone_inputs = self.driver.find_elements(
-                        By.CSS_SELECTOR, "input[type='tel']"
-                    )
-                    if phone_inputs and self.phone_number:
-                        for phone_input in phone_inputs:
+                    if self.phone_number and self._cdp_query(PHONE_INPUTS.selector):
+                        for phone_input in self.driver.find_elements(*PHONE_INPUTS):
                             if not phone_input.get_attribute("value"):
-                                phone_input.send_keys(self.phone_number)
+                                self._fast_type(phone_input, self.phone_number)
                                 notes.append("Filled in phone number")
                 
                 # Check for resume upload
-                resume_uploads = self.driver.find_elements(
-                    By.CSS_SELECTOR, "input[type='file']"
-                )
-                if resume_uploads and self.resume_path:
-                    for upload in resume_uploads:
+                if self.resume_path and self._cdp_query(FILE_INPUTS.selector):
+                    for upload in self.driver.find_elements(*FILE_INPUTS):
                         upload.send_keys(self.resume_path)
                         notes.append("Uploaded resume")
-                        time.sleep(random.uniform(1.0, 2.0))
+                        time.sleep(random.uniform(0.1, 0.3))
                 
                 # Check for follow/unfollow company checkbox
-                follow_checkboxes = self.driver.find_elements(
-                    By.CSS_SELECTOR, "label[for='follow-company-checkbox']"
-                )
-                if follow_checkboxes:
+                if self._cdp_query(FOLLOW_CHECKBOX.selector):
                     # Uncheck the box (we don't want to follow)
-                    follow_checkboxes[0].click()
+                    self.driver.find_element(*FOLLOW_CHECKBOX).click()
                     notes.append("Unchecked 'Follow company'")
-                
+
                 # Click the Next/Continue button
-                next_button = self.driver.find_elements(
-                    By.CSS_SELECTOR, "button[aria-label='Continue to next step']"
-                )
-                if next_button:
+                if self._cdp_query(NEXT_BTN.selector):
                     logger.info(f"Moving to step {current_step + 1}...")
-                    next_button[0].click()
-                    time.sleep(random.uniform(1.0, 2.0))
+                    self.driver.find_element(*NEXT_BTN).click()
+                    self._await_step_change(step_root)
                     current_step += 1
                     continue
-                
+
                 # If we can't find a next button and we're not on the submit step,
                 # we might be stuck or the application requires manual intervention
-                if not submit_button:
+                if not has_submit:
                     logger.warning("Application requires manual intervention")
                     notes.append("Requires manual intervention")
                     
                     # Try to exit the application
-                    exit_buttons = self.driver.find_elements(
-                        By.CSS_SELECTOR, "button[aria-label='Dismiss']"
-                    )
+                    exit_buttons = self.driver.find_elements(*DISMISS_BTN)
                     if exit_buttons:
                         exit_buttons[0].click()
                         
-                        # Confirm exit if prompted
-                        time.sleep(1)
-                        discard_buttons = self.driver.find_elements(
-                            By.CSS_SELECTOR, "button[data-control-name='discard_application_confirm_btn']"
-                        )
+                        # Confirm exit if prompted, waiting only as long as
+                        # the confirmation dialog takes to appear
+                        try:
+                            self.wait_short.until(
+                                EC.presence_of_element_located(DISCARD_CONFIRM_BTN)
+                            )
+                        except TimeoutException:
+                            pass
+                        discard_buttons = self.driver.find_elements(*DISCARD_CONFIRM_BTN)
                         if discard_buttons:
                             discard_buttons[0].click()
                     
@@ -579,17 +977,19 @@ class LinkedInJobBot:
                 
                 # Try to exit the application
                 try:
-                    exit_buttons = self.driver.find_elements(
-                        By.CSS_SELECTOR, "button[aria-label='Dismiss']"
-                    )
+                    exit_buttons = self.driver.find_elements(*DISMISS_BTN)
                     if exit_buttons:
                         exit_buttons[0].click()
                         
-                        # Confirm exit if prompted
-                        time.sleep(1)
-                        discard_buttons = self.driver.find_elements(
-                            By.CSS_SELECTOR, "button[data-control-name='discard_application_confirm_btn']"
-                        )
+                        # Confirm exit if prompted, waiting only as long as
+                        # the confirmation dialog takes to appear
+                        try:
+                            self.wait_short.until(
+                                EC.presence_of_element_located(DISCARD_CONFIRM_BTN)
+                            )
+                        except TimeoutException:
+                            pass
+                        discard_buttons = self.driver.find_elements(*DISCARD_CONFIRM_BTN)
                         if discard_buttons:
                             discard_buttons[0].click()
                 except Exception:
@@ -608,42 +1008,88 @@ class LinkedInJobBot:
             status: Whether the application was successful.
             notes: Notes about the application.
         """
-        application_data = {
-            'Job Title': job_data.get('title', 'Unknown'),
-            'Company': job_data.get('company', 'Unknown'),
-            'Location': job_data.get('location', 'Unknown'),
-            'Application Status': 'Success' if status else 'Failed',
-            'Application Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'Job URL': job_data.get('url', ''),
-            'Notes': notes
-        }
-        
-        # Add to applications data list
-        self.applications_data.append(application_data)
-        
-        # Write to CSV file
-        with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                application_data['Job Title'],
-                application_data['Company'],
-                application_data['Location'],
-                application_data['Application Status'],
-                application_data['Application Date'],
-                application_data['Job URL'],
-                application_data['Notes']
-            ])
-        
-        logger.info(f"Logged application for {application_data['Job Title']} at {application_data['Company']}")
+        title = job_data.get('title', 'Unknown')
+        company = job_data.get('company', 'Unknown')
+        location = job_data.get('location', 'Unknown')
+        status_text = 'Success' if status else 'Failed'
+        date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        url = job_data.get('url', '')
+
+        # One append per column
+        self._col_titles.append(title)
+        self._col_companies.append(company)
+        self._col_locations.append(location)
+        self._col_statuses.append(status_text)
+        self._col_dates.append(date)
+        self._col_urls.append(url)
+        self._col_notes.append(notes)
+
+        # Write to the already-open CSV file
+        self._csv_writer.writerow([title, company, location, status_text, date, url, notes])
+
+        logger.info(f"Logged application for {title} at {company}")
     
-    def run(self, keywords: str, location: str = "Remote", max_applications: int = 20) -> None:
+    def _apply_parallel(self, job_listings: List[Dict], max_applications: int) -> None:
+        """
+        Apply to jobs across several independent Chrome sessions.
+
+        WebDriver instances are not thread-safe, so instead of sharing one
+        driver each worker thread owns a full session — its own browser and
+        login — and works through its share of the collected jobs. The
+        sessions spend most of their time waiting on LinkedIn, so they
+        overlap nearly linearly up to the rate limit.
+
+        Args:
+            job_listings: Collected job data dictionaries.
+            max_applications: Total successful applications to stop at.
+        """
+        logger.info(f"Applying across {self.parallel_sessions} browser sessions...")
+        lock = threading.Lock()
+        success_count = [0]
+
+        def session(jobs: List[Dict]) -> None:
+            worker = LinkedInJobBot(headless=self.headless, stop_event=self.stop_event,
+                                    rate_per_min=self.rate_per_min)
+            try:
+                if not worker.verify_login():
+                    logger.error("Parallel session failed to log in")
+                    return
+                for job_data in jobs:
+                    with lock:
+                        if success_count[0] >= max_applications:
+                            break
+                    if self.stop_event.is_set():
+                        break
+                    status, notes = worker.apply_to_job(job_data)
+                    with lock:
+                        self.log_application(job_data, status, notes)
+                        if status:
+                            success_count[0] += 1
+                    # Each session paces itself; time spent inside the
+                    # application counts toward the interval
+                    worker._bucket.wait()
+            finally:
+                worker.close()
+
+        easy_apply_jobs = [j for j in job_listings if j.get("has_easy_apply", False)]
+        shares = [easy_apply_jobs[i::self.parallel_sessions]
+                  for i in range(self.parallel_sessions)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.parallel_sessions) as pool:
+            # list() so worker exceptions surface here instead of vanishing
+            list(pool.map(session, shares))
+
+    def run(self, keywords: str, location: str = "Remote", max_applications: int = 20,
+            close_on_exit: bool = True) -> None:
         """
         Run the LinkedIn job application bot.
-        
+
         Args:
             keywords: Job keywords to search for.
             location: Job location to search for.
             max_applications: Maximum number of applications to submit.
+            close_on_exit: Whether to close the browser when the run ends.
+                The daemon passes False to keep the logged-in session
+                alive between requests.
         """
         try:
             # Verify login or log in
@@ -661,46 +1107,287 @@ class LinkedInJobBot:
                 logger.error("Failed to search for jobs. Exiting...")
                 return
             
-            # Scroll through job listings
-            job_listings = self.scroll_through_jobs(max_jobs=max_applications * 2)  # Get more than we need in case some fail
-            
-            # Apply to jobs
-            application_count = 0
-            for job_data in job_listings:
-                if application_count >= max_applications:
-                    break
-                
-                if job_data.get("has_easy_apply", False):
-                    status, notes = self.apply_to_job(job_data)
+            if self.parallel_sessions > 1:
+                # Collect first, then fan the apply phase out over extra
+                # browser sessions (each must navigate to its jobs itself)
+                job_listings = self.scroll_through_jobs(max_jobs=max_applications * 2)  # Get more than we need in case some fail
+                self._apply_parallel(job_listings, max_applications)
+            else:
+                # Fused collect-and-apply pass: each Easy Apply card is
+                # applied to straight from the detail pane its card click
+                # renders, skipping the full per-job page load that
+                # navigating back to job_data["url"] would cost
+                application_count = [0]
+
+                def apply_from_pane(job_data: Dict, dom_index: int) -> None:
+                    if application_count[0] >= max_applications or self.stop_event.is_set():
+                        return
+
+                    # Open the right-hand detail pane by clicking the card
+                    # that was just extracted (an in-page update, not a
+                    # navigation)
+                    cards = self.driver.find_elements(By.CSS_SELECTOR, ".jobs-search-results__list-item")
+                    if dom_index >= len(cards):
+                        return
+                    try:
+                        cards[dom_index].click()
+                        self._wait_for(".jobs-unified-top-card")
+                    except (TimeoutException, ElementClickInterceptedException,
+                            StaleElementReferenceException) as e:
+                        logger.warning(f"Could not open job card {dom_index}: {str(e)}")
+                        return
+
+                    status, notes = self.apply_to_job(job_data, navigate=False)
                     self.log_application(job_data, status, notes)
-                    
+
                     if status:
-                        application_count += 1
-                        logger.info(f"Successfully applied to job {application_count}/{max_applications}")
-                    
-                    # Add random delay between applications
-                    time.sleep(random.uniform(3.0, 7.0))
+                        application_count[0] += 1
+                        logger.info(f"Successfully applied to job {application_count[0]}/{max_applications}")
+
+                    # Pace applications to the configured rate; a slow
+                    # application already consumed its interval, so fast
+                    # ones are the only ones that sleep
+                    self._bucket.wait()
+
+                self.scroll_through_jobs(
+                    max_jobs=max_applications * 2,  # Get more than we need in case some fail
+                    on_job=apply_from_pane,
+                )
             
             # Generate summary
-            successful_applications = sum(1 for app in self.applications_data if app['Application Status'] == 'Success')
-            failed_applications = len(self.applications_data) - successful_applications
+            successful_applications = self._col_statuses.count('Success')
+            failed_applications = len(self._col_statuses) - successful_applications
             
             logger.info(f"Application process completed.")
             logger.info(f"Successful applications: {successful_applications}")
             logger.info(f"Failed applications: {failed_applications}")
             logger.info(f"Application data saved to: {self.csv_path}")
             
-            # Create a summary DataFrame
-            if self.applications_data:
-                df = pd.DataFrame(self.applications_data)
-                summary_path = f"output/summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-                df.to_excel(summary_path, index=False)
+            # Create a summary workbook. openpyxl's write-only mode streams
+            # rows straight to disk, and importing it here (instead of
+            # pandas at module level) keeps the Excel dependency off the
+            # startup path entirely. zip() over the column lists yields the
+            # rows without materializing any per-row dicts.
+            if self._col_statuses:
+                from openpyxl import Workbook
+
+                headers = [
+                    'Job Title', 'Company', 'Location', 'Application Status',
+                    'Application Date', 'Job URL', 'Notes'
+                ]
+                summary_path = str(
+                    self.output_dir
+                    / (f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                       f"_pid{os.getpid()}_{self._output_seq}.xlsx")
+                )
+                workbook = Workbook(write_only=True)
+                sheet = workbook.create_sheet("Applications")
+                sheet.append(headers)
+                for row in zip(self._col_titles, self._col_companies,
+                               self._col_locations, self._col_statuses,
+                               self._col_dates, self._col_urls, self._col_notes):
+                    sheet.append(list(row))
+                workbook.save(summary_path)
                 logger.info(f"Summary Excel file saved to: {summary_path}")
         
         finally:
-            # Close the browser
-            logger.info("Closing browser...")
-            self.driver.quit()
+            if close_on_exit:
+                # Close the browser and flush the applications CSV
+                logger.info("Closing browser...")
+                self.close()
+
+
+class SessionPool:
+    """
+    Small pool of logged-in bot sessions shared across query threads.
+
+    The pooled unit is a full LinkedInJobBot — browser, login, pacing
+    bucket — rather than a bare driver, since a driver without its login
+    can't run a search. acquire() blocks until a session is free, so more
+    queries than sessions simply queue up.
+    """
+
+    def __init__(self, size: int, headless: bool = False, rate_per_min: float = 12.0):
+        """
+        Args:
+            size: Number of concurrent browser sessions. Capped at 3;
+                LinkedIn throttles per account, so more buys nothing but
+                restriction risk.
+            headless: Whether sessions run headless.
+            rate_per_min: Per-session target applications per minute.
+        """
+        self.size = max(1, min(3, size))
+        self._bots = [LinkedInJobBot(headless=headless, rate_per_min=rate_per_min)
+                      for _ in range(self.size)]
+        self._idle: queue.Queue = queue.Queue()
+        for bot in self._bots:
+            self._idle.put(bot)
+
+    def acquire(self) -> "LinkedInJobBot":
+        """Block until a session is free and return it."""
+        return self._idle.get()
+
+    def release(self, bot: "LinkedInJobBot") -> None:
+        """Return a session to the pool."""
+        self._idle.put(bot)
+
+    def close_all(self) -> None:
+        """Close every pooled session."""
+        for bot in self._bots:
+            bot.close()
+
+
+def run_multi(keywords_list: List[str], locations: List[str], max_applications: int,
+              headless: bool = False, rate_per_min: float = 12.0, sessions: int = 2) -> None:
+    """
+    Run the Cartesian product of keyword/location queries over a pool.
+
+    Each (keywords, location) pair runs as its own search in whichever
+    pooled browser session comes free; independent queries overlap their
+    network waits instead of running back to back.
+
+    Args:
+        keywords_list: Keyword queries to search for.
+        locations: Locations to pair with each keyword query.
+        max_applications: Maximum applications per query.
+        headless: Whether sessions run headless.
+        rate_per_min: Per-session target applications per minute.
+        sessions: Concurrent browser sessions (capped at 3).
+    """
+    pool = SessionPool(sessions, headless=headless, rate_per_min=rate_per_min)
+    queries = [(kw, loc) for kw in keywords_list for loc in locations]
+    logger.info(f"Running {len(queries)} queries across {pool.size} sessions...")
+
+    def task(kw: str, loc: str) -> None:
+        bot = pool.acquire()
+        try:
+            bot.run(kw, loc, max_applications, close_on_exit=False)
+        finally:
+            pool.release(bot)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=pool.size) as executor:
+            futures = [executor.submit(task, kw, loc) for kw, loc in queries]
+            for future in concurrent.futures.as_completed(futures):
+                error = future.exception()
+                if error is not None:
+                    logger.error(f"Query failed: {str(error)}")
+    finally:
+        pool.close_all()
+
+
+# Default Unix socket for daemon mode, next to the driver/profile caches
+_DAEMON_SOCKET = str(Path.home() / ".cache" / "linkedin_bot" / "daemon.sock")
+
+
+def main_daemon(headless: bool = False, rate_per_min: float = 12.0,
+                socket_path: str = _DAEMON_SOCKET) -> None:
+    """
+    Run the bot as a long-lived server on a local Unix socket.
+
+    Chromedriver startup plus the LinkedIn login flow cost seconds per
+    invocation; scheduled callers can instead keep one logged-in browser
+    alive here and submit searches with --request. Each connection carries
+    one JSON object ({"keywords", "location", "max_applications"});
+    {"command": "shutdown"} stops the server.
+
+    Args:
+        headless: Whether to run the browser in headless mode.
+        rate_per_min: Target applications per minute.
+        socket_path: Filesystem path for the Unix socket.
+    """
+    import socket
+
+    sock_file = Path(socket_path)
+    sock_file.parent.mkdir(parents=True, exist_ok=True)
+    if sock_file.exists():
+        sock_file.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+    logger.info(f"Daemon listening on {socket_path}")
+
+    try:
+        with LinkedInJobBot(headless=headless, rate_per_min=rate_per_min) as bot:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    raw = conn.recv(65536)
+                    if not raw:
+                        continue
+                    try:
+                        request = json.loads(raw)
+                    except ValueError as e:
+                        conn.sendall(json.dumps({"ok": False, "error": f"bad request: {e}"}).encode())
+                        continue
+
+                    if request.get("command") == "shutdown":
+                        conn.sendall(b'{"ok": true}')
+                        break
+
+                    try:
+                        # Keep the session: the browser and its login
+                        # survive for the next request
+                        bot.run(
+                            request.get("keywords", "Data Analyst"),
+                            request.get("location", "Remote"),
+                            int(request.get("max_applications", 20)),
+                            close_on_exit=False,
+                        )
+                        conn.sendall(b'{"ok": true}')
+                    except Exception as e:
+                        # Keep serving after a failed run
+                        logger.error(f"Daemon request failed: {str(e)}", exc_info=True)
+                        conn.sendall(json.dumps({"ok": False, "error": str(e)}).encode())
+    finally:
+        server.close()
+        try:
+            sock_file.unlink()
+        except OSError:
+            pass
+
+
+def main_request(keywords: str, location: str, max_applications: int,
+                 socket_path: str = _DAEMON_SOCKET) -> bool:
+    """
+    Submit a search request to a running daemon.
+
+    Args:
+        keywords: Job keywords to search for.
+        location: Job location to search for.
+        max_applications: Maximum number of applications to submit.
+        socket_path: Filesystem path of the daemon's Unix socket.
+
+    Returns:
+        True if the daemon reported success.
+    """
+    import socket
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError as e:
+        print(f"Could not reach daemon at {socket_path}: {e}")
+        return False
+
+    with client:
+        client.sendall(json.dumps({
+            "keywords": keywords,
+            "location": location,
+            "max_applications": max_applications,
+        }).encode())
+        client.shutdown(socket.SHUT_WR)
+        raw = client.recv(65536)
+
+    try:
+        reply = json.loads(raw)
+    except ValueError:
+        print(f"Malformed reply from daemon: {raw!r}")
+        return False
+
+    print(f"Daemon reply: {reply}")
+    return bool(reply.get("ok"))
 
 
 def main():
@@ -710,25 +1397,55 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='LinkedIn Job Application Bot')
-    parser.add_argument('--keywords', type=str, default='Data Analyst', 
-                        help='Job keywords to search for')
-    parser.add_argument('--location', type=str, default='Remote', 
-                        help='Job location to search for')
+    parser.add_argument('--keywords', type=str, default='Data Analyst',
+                        help='Job keywords to search for (comma-separate for multiple queries)')
+    parser.add_argument('--location', type=str, default='Remote',
+                        help='Job location to search for (comma-separate for multiple queries)')
+    parser.add_argument('--sessions', type=int, default=None,
+                        help='Concurrent browser sessions: fan-out for multi-query runs '
+                             '(default 2), parallel apply phase for a single query '
+                             '(default 1, max 3)')
     parser.add_argument('--max-applications', type=int, default=20, 
                         help='Maximum number of applications to submit')
-    parser.add_argument('--headless', action='store_true', 
+    parser.add_argument('--headless', action='store_true',
                         help='Run in headless mode')
-    
+    parser.add_argument('--rate-per-min', type=float, default=12.0,
+                        help='Target applications per minute')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Run as a long-lived server, reusing one browser session')
+    parser.add_argument('--request', action='store_true',
+                        help='Submit this search to a running daemon instead of starting a browser')
+
     args = parser.parse_args()
-    
+
+    if args.daemon:
+        main_daemon(headless=args.headless, rate_per_min=args.rate_per_min)
+        return
+
+    if args.request:
+        ok = main_request(args.keywords, args.location, args.max_applications)
+        sys.exit(0 if ok else 1)
+
     logger.info("Starting LinkedIn Job Application Bot")
     logger.info(f"Job Keywords: {args.keywords}")
     logger.info(f"Job Location: {args.location}")
     logger.info(f"Max Applications: {args.max_applications}")
     logger.info(f"Headless Mode: {args.headless}")
-    
-    bot = LinkedInJobBot(headless=args.headless)
-    bot.run(args.keywords, args.location, args.max_applications)
+
+    keyword_list = [k.strip() for k in args.keywords.split(',') if k.strip()]
+    location_list = [l.strip() for l in args.location.split(',') if l.strip()]
+
+    if len(keyword_list) > 1 or len(location_list) > 1:
+        run_multi(keyword_list, location_list, args.max_applications,
+                  headless=args.headless, rate_per_min=args.rate_per_min,
+                  sessions=args.sessions if args.sessions is not None else 2)
+        return
+
+    # For a single query, --sessions drives the parallel apply phase; without
+    # the flag the run stays serial as before.
+    with LinkedInJobBot(headless=args.headless, rate_per_min=args.rate_per_min,
+                        parallel_sessions=args.sessions or 1) as bot:
+        bot.run(args.keywords, args.location, args.max_applications)
 
 
 if __name__ == "__main__":
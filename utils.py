@@ -8,19 +8,29 @@ This module provides helper functions for common tasks such as random delays,
 logging, and handling specific application scenarios.
 """
 
+import atexit
+import base64
+import concurrent.futures
+import csv
+import functools
 import os
+import queue
+import re
 import time
 import random
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any, Union
+import logging.handlers
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple, Any, Union
 from pathlib import Path
 
-import pandas as pd
+# pandas, openpyxl, Select, and datetime are imported inside the functions
+# that use them: pandas alone costs hundreds of milliseconds and tens of MB
+# at import, and none of them sit on the bot's startup path.
 from selenium import webdriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, 
@@ -41,40 +51,89 @@ def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
     time.sleep(random.uniform(min_seconds, max_seconds))
 
 
+class TokenBucket:
+    """
+    Rate limiter that paces actions to a target rate instead of fixed sleeps.
+
+    A fixed random_delay wastes wall-clock when the page was fast and
+    under-throttles when it was slow. This sleeps only for whatever is left
+    of the per-action interval — time spent waiting on the page counts
+    toward it — so fast actions proceed immediately while the average rate
+    stays at the configured actions-per-minute. Each interval is jittered
+    so the cadence doesn't look mechanical.
+    """
+
+    def __init__(self, rate_per_min: float):
+        """
+        Args:
+            rate_per_min: Target number of actions per minute.
+        """
+        self.interval = 60.0 / rate_per_min
+        self.next_ok = time.monotonic()
+
+    def wait(self) -> None:
+        """
+        Block until the next action is allowed, then schedule the one after.
+        """
+        now = time.monotonic()
+        if now < self.next_ok:
+            time.sleep(self.next_ok - now)
+        self.next_ok = max(now, self.next_ok) + self.interval * random.uniform(0.7, 1.3)
+
+
+# Logger names already configured by setup_logger. The handlers check alone
+# can't tell our configuration from handlers someone else attached; this
+# records specifically what setup_logger has done.
+_CONFIGURED_LOGGERS: set = set()
+
+
 def setup_logger(name: str, log_file: str, level: str = "INFO") -> logging.Logger:
     """
-    Set up a logger with file and console handlers.
-    
+    Set up a logger that hands records to a background writer thread.
+
+    The log call itself only enqueues the record; a QueueListener on a
+    daemon thread does the actual file/console writes, keeping blocking
+    I/O out of the click/wait inner loop. Calling this again for an
+    already-configured logger returns it unchanged instead of doubling
+    its handlers (and every log line with them).
+
     Args:
         name: Logger name.
         log_file: Path to log file.
         level: Logging level.
-        
+
     Returns:
         Configured logger.
     """
     # Create logger
     logger = logging.getLogger(name)
-    
+    if name in _CONFIGURED_LOGGERS or logger.handlers:
+        return logger
+
     # Convert level string to logging level
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     logger.setLevel(numeric_level)
-    
-    # Create handlers
+
+    # The real handlers live behind the queue, on the listener thread
     file_handler = logging.FileHandler(log_file)
     console_handler = logging.StreamHandler()
-    
+
     # Create formatter
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    
+
     # Set formatter for handlers
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
-    
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+
+    # Log calls become a queue.put; the listener drains to both handlers.
+    # stop() at exit flushes whatever is still queued.
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    _CONFIGURED_LOGGERS.add(name)
     return logger
 
 
@@ -91,10 +150,20 @@ def safe_click(driver: webdriver.Chrome, element: WebElement, wait_time: float =
         True if click was successful, False otherwise.
     """
     try:
-        # Scroll element into view
-        driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        random_delay(0.5, 1.0)
-        
+        # Scroll only when the element is actually outside the viewport;
+        # clicks on already-visible elements skip both the scroll
+        # round-trip and the settle delay the scroll used to need.
+        # element.click() performs its own actionability wait.
+        in_view = driver.execute_script(
+            "var r = arguments[0].getBoundingClientRect();"
+            " return r.top >= 0 && r.bottom <= window.innerHeight;",
+            element
+        )
+        if not in_view:
+            driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center'});", element
+            )
+
         # Try to click the element
         element.click()
         random_delay(wait_time, wait_time + 1.0)
@@ -112,6 +181,57 @@ def safe_click(driver: webdriver.Chrome, element: WebElement, wait_time: float =
             return False
 
 
+# Resolve-and-click in one in-page call. Because the element is looked up
+# and clicked inside the same script, there is no Python-side WebElement to
+# go stale between the two — the retry machinery safe_click needs for held
+# references doesn't apply here.
+_CLICK_CSS_JS = """
+    var el = document.querySelector(arguments[0]);
+    if (!el) return false;
+    el.scrollIntoView({block: 'center'});
+    el.click();
+    return true;
+"""
+_CLICK_XPATH_JS = """
+    var el = document.evaluate(arguments[0], document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!el) return false;
+    el.scrollIntoView({block: 'center'});
+    el.click();
+    return true;
+"""
+
+
+def click_locator(driver: webdriver.Chrome, locator: Tuple[By, str]) -> bool:
+    """
+    Click the element matching a locator in a single script call.
+
+    Prefer this over wait_for_element + safe_click when the element is
+    expected to be present already: one round-trip replaces the polled
+    wait plus the separate click, and a stale reference is impossible
+    since no element handle ever crosses to the Python side.
+
+    Args:
+        driver: Selenium WebDriver instance.
+        locator: Locator or (By, selector) tuple.
+
+    Returns:
+        True if a matching element was found and clicked.
+    """
+    if isinstance(locator, Locator):
+        kind = "xpath" if locator.is_xpath else "css"
+        query = locator.js_query
+    else:
+        by, selector = locator
+        try:
+            kind, query = _BY_TO_QUERY[by](selector)
+        except KeyError:
+            raise ValueError(f"Unsupported locator strategy: {by}")
+
+    script = _CLICK_XPATH_JS if kind == "xpath" else _CLICK_CSS_JS
+    return bool(driver.execute_script(script, query))
+
+
 def wait_for_element(
     driver: webdriver.Chrome, 
     locator: Tuple[By, str], 
@@ -145,21 +265,131 @@ def wait_for_element(
         return None
 
 
+# Resolves a list of ["css"|"xpath", selector] pairs to elements in one
+# in-page call. One execute_script round-trip replaces an independent
+# wait/find round-trip per field when filling a form panel.
+_BATCH_LOCATE_JS = """
+    return arguments[0].map(([kind, sel]) => {
+        if (kind === 'xpath') {
+            return document.evaluate(
+                sel, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        }
+        return document.querySelector(sel);
+    });
+"""
+
+# Converts each By strategy into a selector document.querySelector (or
+# document.evaluate for XPath) understands.
+_BY_TO_QUERY = {
+    By.CSS_SELECTOR: lambda sel: ("css", sel),
+    By.ID: lambda sel: ("css", f"#{sel}"),
+    By.CLASS_NAME: lambda sel: ("css", f".{sel}"),
+    By.NAME: lambda sel: ("css", f"[name='{sel}']"),
+    By.TAG_NAME: lambda sel: ("css", sel),
+    By.XPATH: lambda sel: ("xpath", sel),
+}
+
+
+@dataclass(frozen=True)
+class Locator:
+    """
+    A (By, selector) pair with its in-page query precomputed.
+
+    The JS-probe helpers need the selector in querySelector/evaluate form;
+    computing that once here, instead of branching on the By strategy per
+    call, keeps the probes a straight dictionary-free path. frozen makes
+    instances hashable (usable as cache keys). No slots=True: that keyword
+    needs Python 3.10 and this package supports 3.7+. Unpacks like a plain
+    tuple, so Selenium APIs that take *(by, selector) accept a Locator
+    unchanged.
+    """
+
+    by: str
+    selector: str
+    js_query: str = field(init=False)
+    is_xpath: bool = field(init=False)
+
+    def __post_init__(self):
+        try:
+            kind, query = _BY_TO_QUERY[self.by](self.selector)
+        except KeyError:
+            raise ValueError(f"Unsupported locator strategy: {self.by}")
+        object.__setattr__(self, "js_query", query)
+        object.__setattr__(self, "is_xpath", kind == "xpath")
+
+    def __iter__(self) -> Iterator[str]:
+        yield self.by
+        yield self.selector
+
+
+def batch_locate(
+    driver: webdriver.Chrome,
+    locators: List[Tuple[By, str]]
+) -> List[Optional[WebElement]]:
+    """
+    Locate several elements with a single in-page query.
+
+    Each wait_for_element call costs its own driver round-trip (plus
+    polling); for a form panel that is already rendered, resolving every
+    field in one execute_script collapses those N round-trips into one.
+    Use wait_for_element for the initial "panel visible" gate, then this
+    for the fields inside it.
+
+    Args:
+        driver: Selenium WebDriver instance.
+        locators: List of (By, selector) tuples to resolve.
+
+    Returns:
+        List of elements in the same order as the locators, with None in
+        place of any locator that matched nothing.
+    """
+    queries = []
+    for locator in locators:
+        if isinstance(locator, Locator):
+            queries.append(["xpath" if locator.is_xpath else "css", locator.js_query])
+            continue
+        by, selector = locator
+        try:
+            queries.append(list(_BY_TO_QUERY[by](selector)))
+        except KeyError:
+            raise ValueError(f"Unsupported locator strategy: {by}")
+
+    return driver.execute_script(_BATCH_LOCATE_JS, queries)
+
+
+# Sets a field's value through the prototype's native setter (the pattern
+# React-style inputs require) and fires the input/change events a keystroke
+# sequence would. One round-trip regardless of text length, where
+# clear+send_keys cost one round-trip per character plus one for the clear.
+_SET_VALUE_JS = """
+    var el = arguments[0], value = arguments[1];
+    var proto = el.tagName === 'TEXTAREA'
+        ? window.HTMLTextAreaElement.prototype
+        : window.HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+
 def fill_text_field(
-    driver: webdriver.Chrome, 
-    locator: Tuple[By, str], 
-    text: str, 
+    driver: webdriver.Chrome,
+    locator: Tuple[By, str],
+    text: str,
     clear_first: bool = True
 ) -> bool:
     """
     Fill a text field with the given text.
-    
+
     Args:
         driver: Selenium WebDriver instance.
         locator: Tuple of (By, selector).
         text: Text to enter.
-        clear_first: Whether to clear the field first.
-        
+        clear_first: Whether to replace the current value (True) or
+            append to it (False).
+
     Returns:
         True if successful, False otherwise.
     """
@@ -167,13 +397,15 @@ def fill_text_field(
         element = wait_for_element(driver, locator)
         if not element:
             return False
-        
-        if clear_first:
-            element.clear()
-        
-        element.send_keys(text)
+
+        # The value assignment replaces the content, so appending means
+        # prefixing the existing value
+        if not clear_first:
+            text = (element.get_attribute("value") or "") + text
+
+        driver.execute_script(_SET_VALUE_JS, element, text)
         return True
-    
+
     except Exception as e:
         logging.warning(f"Failed to fill text field {locator}: {str(e)}")
         return False
@@ -196,10 +428,12 @@ def select_dropdown_option(
         True if successful, False otherwise.
     """
     try:
+        from selenium.webdriver.support.ui import Select
+
         element = wait_for_element(driver, locator)
         if not element:
             return False
-        
+
         select = Select(element)
         select.select_by_visible_text(option_text)
         return True
@@ -241,22 +475,66 @@ def check_radio_or_checkbox(
         return False
 
 
+# Existence probes returning a bare bool: no WebElement reference to
+# serialize back and no NoSuchElementException built on the common miss.
+_HAS_CSS_JS = "return document.querySelector(arguments[0]) !== null;"
+_HAS_XPATH_JS = (
+    "return document.evaluate(arguments[0], document, null,"
+    " XPathResult.BOOLEAN_TYPE, null).booleanValue;"
+)
+
+
 def is_element_present(driver: webdriver.Chrome, locator: Tuple[By, str]) -> bool:
     """
     Check if an element is present on the page.
-    
+
+    Runs as a single in-page query rather than find_element, so the
+    negative case — the usual one when probing optional form fields —
+    costs one round-trip and no exception.
+
     Args:
         driver: Selenium WebDriver instance.
         locator: Tuple of (By, selector).
-        
+
     Returns:
         True if element is present, False otherwise.
     """
+    if isinstance(locator, Locator):
+        script = _HAS_XPATH_JS if locator.is_xpath else _HAS_CSS_JS
+        return bool(driver.execute_script(script, locator.js_query))
+
+    by, selector = locator
     try:
-        driver.find_element(locator[0], locator[1])
-        return True
-    except NoSuchElementException:
-        return False
+        kind, query = _BY_TO_QUERY[by](selector)
+    except KeyError:
+        # Strategy with no in-page translation (e.g. link text); keep the
+        # find_element path for correctness
+        try:
+            driver.find_element(by, selector)
+            return True
+        except NoSuchElementException:
+            return False
+
+    script = _HAS_XPATH_JS if kind == "xpath" else _HAS_CSS_JS
+    return bool(driver.execute_script(script, query))
+
+
+# Directories already created this run; lets _ensure_dir skip the stat()
+# syscall os.makedirs(exist_ok=True) performs on every repeat call
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_dir(filepath: str) -> None:
+    """
+    Create the parent directory of a file path, once per process.
+
+    Args:
+        filepath: Path whose parent directory should exist.
+    """
+    directory = os.path.dirname(filepath)
+    if directory and directory not in _ENSURED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
 
 
 def save_to_csv(data: List[Dict], filepath: str, append: bool = False) -> None:
@@ -268,31 +546,118 @@ def save_to_csv(data: List[Dict], filepath: str, append: bool = False) -> None:
         filepath: Path to save the CSV file.
         append: Whether to append to an existing file.
     """
+    import pandas as pd
+
     mode = 'a' if append and os.path.exists(filepath) else 'w'
     write_header = mode == 'w' or not os.path.exists(filepath)
-    
+
     # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    _ensure_dir(filepath)
     
     # Write to CSV
     df = pd.DataFrame(data)
     df.to_csv(filepath, mode=mode, header=write_header, index=False)
 
 
+class CsvAppender:
+    """
+    Streaming CSV writer that keeps its file handle open across calls.
+
+    save_to_csv pays for a pandas DataFrame build plus an open/close pair
+    on every call; for row-at-a-time logging this holds one handle and a
+    csv.DictWriter for the life of the run and appends rows as they come.
+    Rows reach the OS in batches (every flush_every rows and on close),
+    so per-row cost is a buffered write. Usable as a context manager.
+    """
+
+    def __init__(self, filepath: str, fieldnames: List[str], flush_every: int = 50):
+        """
+        Open (or create) the CSV file for appending.
+
+        Args:
+            filepath: Path to the CSV file.
+            fieldnames: Column names, used for the DictWriter and for the
+                header written when the file is new or empty.
+            flush_every: Number of rows between explicit flushes.
+        """
+        _ensure_dir(filepath)
+
+        new_file = not os.path.exists(filepath) or os.path.getsize(filepath) == 0
+        self._fh = open(filepath, 'a', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._fh, fieldnames=fieldnames)
+        self._flush_every = flush_every
+        self._rows_since_flush = 0
+
+        if new_file:
+            self._writer.writeheader()
+
+    def writerow(self, row: Dict) -> None:
+        """
+        Append a single row, flushing every flush_every rows.
+
+        Args:
+            row: Mapping of fieldname to value.
+        """
+        self._writer.writerow(row)
+        self._rows_since_flush += 1
+        if self._rows_since_flush >= self._flush_every:
+            self.flush()
+
+    def writerows(self, rows: List[Dict]) -> None:
+        """
+        Append several rows at once.
+
+        Args:
+            rows: List of fieldname-to-value mappings.
+        """
+        for row in rows:
+            self.writerow(row)
+
+    def flush(self) -> None:
+        """Push buffered rows to the OS."""
+        self._fh.flush()
+        self._rows_since_flush = 0
+
+    def close(self) -> None:
+        """Flush and close the underlying file."""
+        if not self._fh.closed:
+            self._fh.close()
+
+    def __enter__(self) -> "CsvAppender":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
 def save_to_excel(data: List[Dict], filepath: str) -> None:
     """
     Save data to an Excel file.
-    
+
+    Streams rows straight into an openpyxl write-only workbook; the
+    DataFrame this used to build only existed to be re-iterated into
+    cells, paying a full columnar copy plus dtype inference on the way.
+
     Args:
         data: List of dictionaries to save.
         filepath: Path to save the Excel file.
     """
+    # Imported here so the Excel dependency is only paid when exporting
+    from openpyxl import Workbook
+
     # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    
-    # Write to Excel
-    df = pd.DataFrame(data)
-    df.to_excel(filepath, index=False)
+    _ensure_dir(filepath)
+
+    # Write-only mode serializes each appended row immediately instead of
+    # building the in-memory cell grid
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    if data:
+        fieldnames = list(data[0].keys())
+        sheet.append(fieldnames)
+        for row in data:
+            sheet.append([row.get(key) for key in fieldnames])
+    workbook.save(filepath)
 
 
 def create_timestamp_filename(prefix: str, extension: str) -> str:
@@ -306,8 +671,9 @@ def create_timestamp_filename(prefix: str, extension: str) -> str:
     Returns:
         Filename with timestamp.
     """
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    return f"{prefix}_{timestamp}.{extension}"
+    # time.strftime formats the current local time directly — no datetime
+    # object (tz lookup, microsecond capture) built just to be formatted
+    return f"{prefix}_{time.strftime('%Y%m%d_%H%M%S')}.{extension}"
 
 
 def extract_text_safely(element: Optional[WebElement]) -> str:
@@ -329,6 +695,11 @@ def extract_text_safely(element: Optional[WebElement]) -> str:
         return ""
 
 
+# Accepted truthy spellings; a frozenset constant gives a hashed O(1)
+# membership check instead of rebuilding and scanning a list per call
+_TRUTHY = frozenset(("yes", "true", "y", "1", "t"))
+
+
 def parse_boolean_response(text: str) -> bool:
     """
     Parse a text response as a boolean.
@@ -339,57 +710,136 @@ def parse_boolean_response(text: str) -> bool:
     Returns:
         True for "yes", "true", "y", "1", etc., False otherwise.
     """
-    text = text.lower().strip()
-    return text in ["yes", "true", "y", "1", "t"]
+    return text.strip().lower() in _TRUTHY
+
+
+# Question keyword groups and the default_answers key each maps to; single
+# source for both matching backends below.
+_KEYWORD_GROUPS = (
+    (("years of experience", "how long", "work experience"), "years_of_experience"),
+    (("education", "degree", "qualification"), "education_level"),
+    (("relocate", "relocation", "willing to move"), "willing_to_relocate"),
+    (("sponsorship", "visa", "work authorization"), "require_sponsorship"),
+    (("remote", "work from home", "telecommute"), "remote_work"),
+)
+
+# Preferred backend: an Aho-Corasick automaton walks the question once in C
+# and reports every keyword hit, regardless of how many keywords the table
+# grows to. pyahocorasick is optional; without it the compiled-alternation
+# regex below does the same scan with the table at its current size.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    _QUESTION_AUTOMATON = ahocorasick.Automaton()
+    for _kws, _key in _KEYWORD_GROUPS:
+        for _kw in _kws:
+            _QUESTION_AUTOMATON.add_word(_kw, _key)
+    _QUESTION_AUTOMATON.make_automaton()
+else:
+    _QUESTION_AUTOMATON = None
+
+# Fallback: all groups compiled into one alternation; a single re.search
+# (C-level scan) replaces per-keyword Python `in` loops.
+_QUESTION_RE = re.compile(
+    "|".join(
+        f"(?P<g{i}>{'|'.join(re.escape(kw) for kw in kws)})"
+        for i, (kws, _) in enumerate(_KEYWORD_GROUPS)
+    ),
+    re.IGNORECASE,
+)
+
+# Matched group name -> default_answers key
+_ANSWER_KEYS = {f"g{i}": key for i, (_, key) in enumerate(_KEYWORD_GROUPS)}
+
+# Table order is the answer priority: when a question matches several
+# groups ("willing to work remote given your education?"), the earlier
+# group wins, mirroring the original if-chain's fixed check order.
+_KEY_PRIORITY = {key: i for i, (_, key) in enumerate(_KEYWORD_GROUPS)}
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_question(question: str) -> Optional[str]:
+    """
+    Map a question to its default_answers key, or None if unrecognized.
+
+    One pass collects every matching group and the highest-priority one
+    wins — a leftmost keyword from a later group must not shadow an
+    earlier group's match. Easy Apply forms repeat the same question text
+    across applications, so the scan is memoized on the question string;
+    caching the key rather than the answer keeps the cache valid across
+    answer dicts.
+    """
+    best = None
+    if _QUESTION_AUTOMATON is not None:
+        for _, key in _QUESTION_AUTOMATON.iter(question.lower()):
+            if best is None or _KEY_PRIORITY[key] < _KEY_PRIORITY[best]:
+                best = key
+        return best
+
+    for match in _QUESTION_RE.finditer(question):
+        key = _ANSWER_KEYS[match.lastgroup]
+        if best is None or _KEY_PRIORITY[key] < _KEY_PRIORITY[best]:
+            best = key
+    return best
 
 
 def get_answer_for_question(question: str, default_answers: Dict[str, str]) -> Optional[str]:
     """
     Get an answer for a common application question.
-    
+
     Args:
         question: The question text.
         default_answers: Dictionary of default answers.
-        
+
     Returns:
         Answer for the question, or None if no match found.
     """
-    question = question.lower()
-    
-    # Experience questions
-    if any(kw in question for kw in ["years of experience", "how long", "work experience"]):
-        return default_answers.get("years_of_experience")
-    
-    # Education questions
-    if any(kw in question for kw in ["education", "degree", "qualification"]):
-        return default_answers.get("education_level")
-    
-    # Relocation questions
-    if any(kw in question for kw in ["relocate", "relocation", "willing to move"]):
-        return default_answers.get("willing_to_relocate")
-    
-    # Sponsorship questions
-    if any(kw in question for kw in ["sponsorship", "visa", "work authorization"]):
-        return default_answers.get("require_sponsorship")
-    
-    # Remote work questions
-    if any(kw in question for kw in ["remote", "work from home", "telecommute"]):
-        return default_answers.get("remote_work")
-    
-    return None
+    key = _classify_question(question)
+    return default_answers.get(key) if key else None
+
 
+# Single writer thread for asynchronous screenshot saves; created on first
+# use and drained at interpreter exit
+_SCREENSHOT_WRITER: Optional[concurrent.futures.ThreadPoolExecutor] = None
 
-def take_screenshot(driver: webdriver.Chrome, filepath: str) -> None:
+
+def take_screenshot(driver: webdriver.Chrome, filepath: str, block: bool = True) -> None:
     """
     Take a screenshot of the current browser window.
-    
+
+    Captures through CDP as JPEG at quality 60 — typically 5-10x smaller
+    and faster to encode than save_screenshot's full-size PNG, which
+    matters when capturing one shot per application. Use a .jpg filepath.
+
     Args:
         driver: Selenium WebDriver instance.
         filepath: Path to save the screenshot.
+        block: When False, the decode and disk write happen on a
+            background writer thread so the bot doesn't wait on I/O.
     """
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    
-    # Take screenshot
-    driver.save_screenshot(filepath)
-    logging.info(f"Screenshot saved to {filepath}")
\ No newline at end of file
+    global _SCREENSHOT_WRITER
+
+    result = driver.execute_cdp_cmd("Page.captureScreenshot", {
+        "format": "jpeg",
+        "quality": 60,
+    })
+    encoded = result["data"]
+
+    def write() -> None:
+        _ensure_dir(filepath)
+        with open(filepath, "wb") as f:
+            f.write(base64.b64decode(encoded))
+        logging.info(f"Screenshot saved to {filepath}")
+
+    if block:
+        write()
+        return
+
+    if _SCREENSHOT_WRITER is None:
+        _SCREENSHOT_WRITER = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="screenshot")
+        atexit.register(_SCREENSHOT_WRITER.shutdown)
+    _SCREENSHOT_WRITER.submit(write)
\ No newline at end of file